@@ -1,7 +1,48 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from fit.csv import export_to_csv, import_from_csv
-from fit.distribution import *
-from fit.elf import ELF
-from fit.fitlib import gdb_injector
-from fit.injector import Injector
+from fit.distribution import Distribution, Fixed, Normal, Uniform
 from fit.logger import Logger
-from fit.stencil import Stencil
+
+if TYPE_CHECKING:
+    from fit.elf import ELF
+    from fit.fitlib import gdb_injector
+    from fit.injector import Injector
+    from fit.stencil import Stencil
+
+## These pull in lief and the injector backends, so they are only imported on first use
+LAZY_IMPORTS = {
+    "ELF": "fit.elf",
+    "gdb_injector": "fit.fitlib",
+    "Injector": "fit.injector",
+    "Stencil": "fit.stencil",
+}
+
+__all__ = [
+    "export_to_csv",
+    "import_from_csv",
+    "Distribution",
+    "Fixed",
+    "Normal",
+    "Uniform",
+    "Logger",
+    "ELF",
+    "gdb_injector",
+    "Injector",
+    "Stencil",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Function that imports the public names of the heavy submodules on first access.
+
+    :param name: the name of the attribute.
+    :return: the attribute.
+    """
+
+    if (module := LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(module), name)
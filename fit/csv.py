@@ -13,14 +13,15 @@ def import_from_csv(file_path: str) -> dict[str, Any]:
     :return: the dictionary containing the CSV data, where each key is a column header and the value is a list of column entries.
     """
     csv.field_size_limit(sys.maxsize)
-    result: dict[str, list[Any]] = {}
     with open(file_path, mode="r", newline="", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            for key, value in row.items():
-                if key not in result:
-                    result[key] = []
-                result[key].append(value)
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return {}
+
+        ## Transpose the rows into columns in one pass instead of building a dict per row
+        columns = zip(*reader)
+        result: dict[str, list[Any]] = {key: list(column) for key, column in zip(header, columns)}
     return result
 
 
@@ -49,8 +50,7 @@ def export_to_csv(file_path: str, data: dict[str, Any]) -> None:
     }
 
     with open(file_path, mode="w", newline="", encoding="utf-8") as file:
-        writer = csv.DictWriter(file, fieldnames=data.keys())
-        writer.writeheader()
-        for i in range(max_length):
-            row = {key: normalized_data[key][i] for key in data}
-            writer.writerow(row)
+        writer = csv.writer(file)
+        writer.writerow(data.keys())
+        ## Transpose the columns into rows and hand them all to the writer at once
+        writer.writerows(zip(*normalized_data.values(), strict=True))
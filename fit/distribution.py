@@ -1,3 +1,5 @@
+import bisect
+import itertools
 import random
 from abc import ABC, abstractmethod
 
@@ -98,11 +100,14 @@ class Fixed(Distribution):
 
     """The list of probabilities for each case. The probabilities must sum to 1."""
     cases: list[float]
+    """The cumulative sum of the probabilities, used to pick a case with a single draw."""
+    cdf: list[float]
 
     def __init__(self, cases: list[float]) -> None:
         assert 1 - sum(cases) <= 1e-6, "Probabilities must sum to 1."
 
         self.cases = cases
+        self.cdf = list(itertools.accumulate(cases))
         self.start_bit = 0
         self.end_bit = len(cases) - 1
 
@@ -113,4 +118,4 @@ class Fixed(Distribution):
         :return: the random value.
         """
 
-        return random.choices(range(len(self.cases)), weights=self.cases)[0]
+        return bisect.bisect(self.cdf, random.random() * self.cdf[-1], 0, self.end_bit)
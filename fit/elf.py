@@ -33,16 +33,20 @@ class ELF:
 
         def __init__(self, bin: lief.ELF.Binary) -> None:
             self.__bin = bin
+            self.__by_name: dict[str, lief.Symbol] = {}
 
         def __getitem__(self, name: str) -> lief.Symbol:
             """
-            Gets a symbol by its name.
+            Gets a symbol by its name. Each name is looked up in the binary only once.
 
             :param name: the name of the symbol.
             :return: the symbol with the specified name.
             """
 
-            return self.__bin.get_symbol(name)
+            if name not in self.__by_name:
+                self.__by_name[name] = self.__bin.get_symbol(name)
+
+            return self.__by_name[name]
 
     class Sections:
         """
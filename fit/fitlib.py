@@ -7,6 +7,7 @@ def gdb_injector(
     remote: str | None = None,
     embedded: bool = True,
     board_family: str | None = None,
+    cache_memory: bool = False,
 ) -> Injector:
     """
     Function that creates an Injector instance for GDB with optional parameters.
@@ -16,6 +17,8 @@ def gdb_injector(
     :param remote: the remote target for GDB. Default is None.
     :param embedded: the flag that indicates if the target is embedded. Default is True.
     :param board_family: the family of the embedded board, if applicable. Default is None.
+    :param cache_memory: the flag that lets memory reads be cached while the target is stopped.
+    Default is False.
     :return: the instance of Injector configured for GDB.
     """
 
@@ -30,4 +33,4 @@ def gdb_injector(
     if embedded and board_family is not None:
         kwargs["board_family"] = board_family
 
-    return Injector(bin, "gdb", **kwargs)
+    return Injector(bin, "gdb", cache_memory=cache_memory, **kwargs)
@@ -36,12 +36,15 @@ class Registers:
     elf: ELF
     """The registers."""
     registers: list[str]
+    """The registers, for constant time lookups."""
+    register_set: frozenset[str]
 
     def __init__(self, injector: InternalInjector, bin: ELF) -> None:
         self.__internal_injector = injector
         self.elf = bin
 
         self.registers = self.__internal_injector.get_register_names()
+        self.register_set = frozenset(self.registers)
 
     def __getitem__(self, name: str) -> int:
         """
@@ -51,11 +54,26 @@ class Registers:
         :return: the register value.
         """
 
-        if name.lower() not in self.registers:
+        if name.lower() not in self.register_set:
             log.critical(f"Register {name} not found")
 
         return self.__internal_injector.read_register(name)
 
+    def read_many(self, names: list[str]) -> list[int]:
+        """
+        Gets the values of several registers with a single request.
+
+        :param names: the names of the registers.
+        :return: the register values, in the same order.
+        """
+
+        for name in names:
+            if name.lower() not in self.register_set:
+                log.critical(f"Register {name} not found")
+
+        values = self.__internal_injector.read_registers(names)
+        return [values[name] for name in names]
+
     def __setitem__(self, name: str, value: int | list[int] | IntList) -> None:
         """
         Sets the value of a register by name.
@@ -64,7 +82,7 @@ class Registers:
         :param value: the register value.
         """
 
-        if name not in self.registers:
+        if name not in self.register_set:
             log.critical(f"Register {name} not found")
 
         if isinstance(value, IntList) or isinstance(value, list):
@@ -107,16 +125,19 @@ class Injector:
             self.kwargs = kwargs
 
     """The events."""
-    events: dict[str, Event] = {}
+    events: dict[str, Event]
+    """The events currently armed in the internal injector."""
+    armed_events: set[str]
     """The golden run. Dictionary with (target, value) pairs."""
-    golden: dict[str, list[Any]] = {}
+    golden: dict[str, list[Any]]
     """The injected run. Dictionary with (target, value) pairs."""
-    runs: dict[str, list[Any]] = {}
+    runs: dict[str, list[Any]]
 
     def __init__(
         self,
         bin: str,
         implementation: str = "gdb",
+        cache_memory: bool = False,
         **kwargs: Any,
     ) -> None:
         impl = Implementation.from_string(implementation)
@@ -126,16 +147,22 @@ class Injector:
         self.__internal_injector = impl(bin, **kwargs)
 
         self.regs = Registers(self.__internal_injector, self.binary)
-        self.memory = Memory(self.__internal_injector, self.binary)
+        self.memory = Memory(self.__internal_injector, self.binary, cache=cache_memory)
+        self.events = {}
+        self.armed_events = set()
         self.runs = defaultdict(list)
         self.golden = defaultdict(list)
 
-    def reset(self) -> None:
+    def reset(self, keep_conditions: bool = False) -> None:
         """
         Function that resets the internal injector instance.
+
+        :param keep_conditions: whether the result conditions already set stay in place.
         """
 
-        self.__internal_injector.reset()
+        self.__internal_injector.reset(keep_events=keep_conditions)
+        if not keep_conditions:
+            self.armed_events.clear()
 
     def set_result_condition(
         self, event: str, callback: Callable[..., Any] = noop, **kwargs: dict[str, Any]
@@ -148,7 +175,10 @@ class Injector:
         :param kwargs: the additional arguments for the callback function.
         """
 
-        self.__internal_injector.set_event(event)
+        ## An event still armed since the last reset only needs its callback updated
+        if event not in self.armed_events:
+            self.__internal_injector.set_event(event)
+            self.armed_events.add(event)
 
         self.events[event] = self.Event(callback, **kwargs)
 
@@ -186,9 +216,7 @@ class Injector:
 
         if injection_delay is None or inject_func is None:
             if timeout is None:
-                ev = self.__internal_injector.run(blocking=True)
-                self.events[ev].callback(self, **self.events[ev].kwargs)
-                return ev
+                return self.trigger(self.__internal_injector.run(blocking=True))
             else:
                 inject_func = lambda _: ...
                 injection_delay = timedelta(0)
@@ -201,16 +229,14 @@ class Injector:
             """
             if (event := self.__internal_injector.run(blocking=False)) != "unknown":
                 log.warning("Event triggered before injection")
-                self.events[event].callback(self, **self.events[event].kwargs)
 
-                return event
+                return self.trigger(event)
 
             time.sleep(injection_delay.total_seconds())
             if (event := self.__internal_injector.interrupt()) is not None:
                 log.warning("Event triggered before injection")
-                self.events[event].callback(self, **self.events[event].kwargs)
 
-                return event
+                return self.trigger(event)
 
             inject_func(self)
 
@@ -229,9 +255,22 @@ class Injector:
                 stop_event.set()
                 return "Timeout"
 
-            self.events[event].callback(self, **self.events[event].kwargs)
+            return self.trigger(event)
+
+    def trigger(self, event: str) -> str:
+        """
+        Function that calls the callback of the event the target stopped on.
+        The target exiting is reported as "exit", which only has a callback if a result condition
+        was set for it.
+
+        :param event: the event name.
+        :return: the event name.
+        """
+
+        if (ev := self.events.get(event)) is not None:
+            ev.callback(self, **ev.kwargs)
 
-            return event
+        return event
 
     def close(self) -> None:
         """
@@ -46,6 +46,27 @@ def check(data: dict[str, Any], wait_for: dict[str, Any]) -> bool:
     return True
 
 
+def find_match(response: gdb_response, wait: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """
+    Function that looks for the first record of a response matching any of the expected patterns.
+    An error record aborts.
+
+    :param response: the records to search.
+    :param wait: the expected response patterns.
+    :return: the matching record, or None if there is none.
+    """
+
+    for msg in response:
+        if "message" in msg and msg["message"] == "error":
+            log.critical(f"{msg['payload']}")
+
+        for w in wait:
+            if check(msg, w):
+                return msg
+
+    return None
+
+
 class GDBController:
     """
     Class that abstracts GDB MI interactions and provides command writing, response filtering, and graceful shutdown.
@@ -53,9 +74,21 @@ class GDBController:
 
     """The controller."""
     controller: GdbController
+    """The token of the last submitted command."""
+    token: int
+    """The tokens of the submitted commands whose result record has not been read yet."""
+    pending: set[int]
+    """The result records received for submitted commands, indexed by token."""
+    completed: dict[int, dict[str, Any]]
+    """The other records read while waiting for a token, handed to the next read."""
+    backlog: gdb_response
 
     def __init__(self, command: list[str]) -> None:
         self.controller = GdbController(command=command)
+        self.token = 0
+        self.pending = set()
+        self.completed = {}
+        self.backlog = []
 
     def write(
         self,
@@ -72,13 +105,105 @@ class GDBController:
         :return: the list of response dictionaries from GDB.
         """
 
-        log.debug(f"--> {command}")
-        r: gdb_response = self.controller.write(command, raise_error_on_timeout=False)
+        log.debug("--> %s", command)
+        r = self.received(self.controller.write(command, raise_error_on_timeout=False))
 
         if wait_for is not None:
             return self.await_response(r, wait_for, whole_response)
 
-        log.debug(f"<-- {r}")
+        log.debug("<-- %s", r)
+
+        return r
+
+    def submit(self, command: str) -> int:
+        """
+        Function that sends a command to GDB without waiting for its result.
+        Other commands can be written before it is awaited with `await_token`, its result is kept
+        aside when they read it.
+
+        :param command: the command string to send.
+        :return: the token identifying the command's result.
+        """
+
+        self.token += 1
+        self.pending.add(self.token)
+        log.debug("--> %d%s", self.token, command)
+        self.controller.write(
+            f"{self.token}{command}", raise_error_on_timeout=False, read_response=False
+        )
+
+        return self.token
+
+    def await_token(self, token: int) -> dict[str, Any]:
+        """
+        Function that waits for the result record of a submitted command.
+        Results of other submitted commands received in the meantime are kept for their own
+        `await_token`, any other record for the next read of the session.
+
+        :param token: the token returned by `submit`.
+        :return: the result record of the command.
+        """
+
+        while token not in self.completed:
+            r: gdb_response = self.controller.get_gdb_response(raise_error_on_timeout=False)
+            log.debug("<-- %s", r)
+
+            self.backlog.extend(self.collect(r))
+
+        msg = self.completed.pop(token)
+        if msg["message"] == "error":
+            log.critical(f"{msg['payload']}")
+
+        return msg
+
+    def collect(self, response: gdb_response) -> gdb_response:
+        """
+        Function that stores the result records of submitted commands found in a response.
+
+        :param response: the records to scan.
+        :return: the other records, in order.
+        """
+
+        if not self.pending:
+            return response
+
+        rest = []
+        for msg in response:
+            if msg["type"] == "result" and msg["token"] in self.pending:
+                self.pending.discard(msg["token"])
+                self.completed[msg["token"]] = msg
+            else:
+                rest.append(msg)
+
+        return rest
+
+    def received(self, response: gdb_response) -> gdb_response:
+        """
+        Function that prepares freshly read records for a waiter.
+        The records kept back while waiting for a token come first, the results of submitted
+        commands are set aside for their `await_token`.
+
+        :param response: the records just read.
+        :return: the records the waiter gets to see, in order.
+        """
+
+        response = self.collect(response)
+        if self.backlog:
+            response, self.backlog = self.backlog + response, []
+
+        return response
+
+    def poll(self) -> gdb_response:
+        """
+        Function that returns the records GDB has already written, without waiting for more.
+
+        :return: the list of response dictionaries.
+        """
+
+        r = self.received(
+            self.controller.get_gdb_response(timeout_sec=0, raise_error_on_timeout=False)
+        )
+        log.debug("<-- %s", r)
 
         return r
 
@@ -87,8 +212,8 @@ class GDBController:
         Function that flushes any pending GDB output without action on it
         """
 
-        r: gdb_response = self.controller.get_gdb_response(raise_error_on_timeout=False)
-        log.debug(f"<-- {r}")
+        r = self.received(self.controller.get_gdb_response(raise_error_on_timeout=False))
+        log.debug("<-- %s", r)
 
         if r == []:
             return
@@ -107,11 +232,11 @@ class GDBController:
         :return: the list of response dictionaries.
         """
 
-        r: gdb_response = self.controller.get_gdb_response(raise_error_on_timeout=False)
+        r = self.received(self.controller.get_gdb_response(raise_error_on_timeout=False))
         if wait_for is not None:
             return self.await_response(r, wait_for, whole_response, stop_event)
 
-        log.debug(f"<-- {r}")
+        log.debug("<-- %s", r)
         return r
 
     def exit(self) -> None:
@@ -142,22 +267,19 @@ class GDBController:
         else:
             wait = wait_for
 
+        ## Large outputs span several reads, keep the earlier records for the whole response
+        history: gdb_response = []
         while True:
             if stop_event and stop_event.is_set():
                 return []
 
-            log.debug(f"<-- {request_response}")
-
-            for msg in request_response:
-                if "message" in msg and msg["message"] == "error":
-                    log.critical(f"{msg['payload']}")
-                    return request_response
-
-                for w in wait:
-                    if check(msg, w):
-                        if whole_response:
-                            return request_response
+            log.debug("<-- %s", request_response)
+            if whole_response:
+                history.extend(request_response)
 
-                        return [msg]
+            if (msg := find_match(request_response, wait)) is not None:
+                return history if whole_response else [msg]
 
-            request_response = self.controller.get_gdb_response(raise_error_on_timeout=False)
+            request_response = self.collect(
+                self.controller.get_gdb_response(raise_error_on_timeout=False)
+            )
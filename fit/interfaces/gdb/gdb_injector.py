@@ -1,20 +1,125 @@
+import binascii
 import enum
-import re
+import itertools
+import logging
 import struct
 import threading
 import time
-from typing import Any, Literal, cast
+from functools import lru_cache
+from typing import Any, Iterator, Literal, cast
 
 from fit import logger
 from fit.interfaces.gdb.boards import BoardsFamilies
 from fit.interfaces.gdb.controller import GDBController, gdb_response
-from fit.interfaces.internal_injector import InternalInjector
+from fit.interfaces.internal_injector import WORD_FORMATS, InternalInjector
 from fit.mapping import Mapping
 
 log = logger.get()
 
 GDB_FLAGS = ["-q", "--nx", "--interpreter=mi3"]
 
+"""Remote protocol settings applied before connecting."""
+REMOTE_SETTINGS = [
+    "remote memory-read-packet-size 16384",
+    "remote memory-write-packet-size 16384",
+]
+
+"""Response templates shared by every command. They must not be mutated."""
+WAIT_DONE: dict[str, Any] = {"message": "done", "payload": None, "type": "result"}
+WAIT_MEMORY: dict[str, Any] = {
+    "message": "done",
+    "payload": {"memory": []},
+    "stream": "stdout",
+    "token": None,
+    "type": "result",
+}
+WAIT_RUNNING: dict[str, Any] = {"type": "result", "message": "running", "payload": None}
+WAIT_STOPPED: dict[str, Any] = {"type": "notify", "message": "stopped", "payload": None}
+WAIT_INTERRUPTED: list[dict[str, Any]] = [
+    {
+        "type": "notify",
+        "message": "stopped",
+        "payload": {
+            "reason": "signal-received",
+            "signal-name": "SIGINT",
+            "signal-meaning": "Interrupt",
+            "frame": {},
+            "thread-id": None,
+        },
+    },
+    {
+        "type": "notify",
+        "message": "stopped",
+        "payload": {"reason": "breakpoint-hit", "bkptno": None},
+    },
+    {
+        "type": "notify",
+        "message": "stopped",
+        "payload": {
+            "reason": "signal-received",
+            "signal-name": "SIGTRAP",
+            "signal-meaning": "Trace/breakpoint trap",
+        },
+    },
+]
+WAIT_BREAKPOINT: dict[str, Any] = {"message": "done", "payload": {"bkpt": {}}, "type": "result"}
+WAIT_BREAKPOINT_DELETED: dict[str, Any] = {
+    "message": "breakpoint-deleted",
+    "payload": {"id": None},
+    "type": "notify",
+}
+WAIT_REGISTER_NAMES: dict[str, Any] = {
+    "type": "result",
+    "message": "done",
+    "payload": {"register-names": []},
+}
+WAIT_REGISTER_VALUES: dict[str, Any] = {
+    "message": "done",
+    "payload": {"register-values": []},
+    "type": "result",
+}
+
+"""STM32 Debug Halting Control and Status Register and its reset status bit."""
+STM32_REG_DHCSR = 0xE000EDF0
+STM32_REG_DHCSR_S_RESET_ST = 1 << 25
+
+"""Stop reasons reported when the process is gone."""
+EXIT_REASONS = {"exited-normally", "exited", "exited-signalled"}
+
+"""Permission flags indexed by every possible 'rwxp' column of a mapping row."""
+PERMISSIONS_TABLE = {
+    "".join(perms): sum(
+        flag
+        for perm, char, flag in zip(
+            perms,
+            "rwxp",
+            (
+                Mapping.Permissions.READ,
+                Mapping.Permissions.WRITE,
+                Mapping.Permissions.EXEC,
+                Mapping.Permissions.PRIVATE,
+            ),
+        )
+        if perm == char
+    )
+    for perms in itertools.product("r-", "w-", "x-", "ps-")
+}
+
+
+@lru_cache(maxsize=256)
+def get_struct(byteorder: Literal["little", "big"], word_size: int, count: int) -> struct.Struct:
+    """
+    Function that returns a cached struct for packing and unpacking a sequence of words.
+
+    :param byteorder: the endianness of the words (little or big).
+    :param word_size: the size of each word in bytes.
+    :param count: the number of words.
+    :return: the compiled struct.
+    """
+
+    endianness = "<" if byteorder == "little" else ">"
+    return struct.Struct(f"{endianness}{count}{WORD_FORMATS[word_size]}")
+
 
 def parse_memory(
     memory: list[dict[str, Any]],
@@ -31,18 +136,23 @@ def parse_memory(
         stop = int(chunk["end"], 16)
         begin = int(chunk["begin"], 16)
 
-        val = chunk["contents"]
-        last = (stop - begin) // word_size
-        for i in range(last):
-            ## We do word_size * 2 since in text 2 chars are a byte
-            ini = i * word_size * 2
-            end = (i + 1) * word_size * 2
-            res[off + i] = get_int(val[ini:end], endianness)
+        data = binascii.unhexlify(chunk["contents"])
+        ## The offset is in bytes, the result is in words; a chunk never extends the result
+        index = off // word_size
+        words_in_chunk = (stop - begin) // word_size
+        last = max(0, min(words_in_chunk, size - index))
+        if word_size in WORD_FORMATS:
+            words = get_struct(endianness, word_size, last).unpack_from(data)
+            res[index : index + last] = words
+        else:
+            for i in range(last):
+                res[index + i] = int.from_bytes(
+                    data[i * word_size : (i + 1) * word_size], endianness
+                )
 
         if remainder > 0:
-            ## Convert to index like above
-            last = last * word_size * 2
-            res[-1] = get_int(val[last : last + remainder * 2], endianness)
+            last = words_in_chunk * word_size
+            res[-1] = int.from_bytes(data[last : last + remainder], endianness)
 
     return res
 
@@ -56,6 +166,10 @@ def get_int(s: str, byteorder: Literal["little", "big"]) -> int:
     :return: the integer value
     """
 
+    if byteorder == "big":
+        ## The hex text is already most significant byte first
+        return int(s, 16) if s else 0
+
     b = bytes.fromhex(s)
     return int.from_bytes(b, byteorder=byteorder)
 
@@ -69,15 +183,15 @@ def to_gdb_hex(i: list[int], byteorder: Literal["little", "big"], word_size: int
     :return: the hex string representation of the integer value.
     """
 
-    bits = "I" if word_size == 4 else "Q"
-    endiannes = "<" if byteorder == "little" else ">"
+    if len(i) == 1:
+        return i[0].to_bytes(word_size, byteorder).hex()
 
-    byte_array = struct.pack(endiannes + bits * len(i), *i)
+    if word_size not in WORD_FORMATS:
+        return b"".join(v.to_bytes(word_size, byteorder) for v in i).hex()
 
-    # if byteorder == "big":
-    #     byte_array = byte_array[::-1]
+    byte_array = get_struct(byteorder, word_size, len(i)).pack(*i)
 
-    return "".join(f"{b:02x}" for b in byte_array)
+    return byte_array.hex()
 
 
 class GDBInjector(InternalInjector):
@@ -91,6 +205,10 @@ class GDBInjector(InternalInjector):
     gdb_path: str = "gdb_multiarch"
     """List of available register names."""
     register_names: list[str]
+    """GDB register numbers indexed by register name."""
+    _register_numbers: dict[str, int]
+    """Indicates if the remote protocol should run without packet acknowledgments."""
+    no_ack: bool = True
     """Indicates if the target is an embedded device."""
     embedded: bool = False
     """Enum representing known embedded board families."""
@@ -99,12 +217,16 @@ class GDBInjector(InternalInjector):
     endianness = cast(Literal["little", "big"], "little")
     """Word size in bytes."""
     word_size: int = 4
+    """Struct for a single word of the target, bound once the word size is known."""
+    _word_struct: struct.Struct | None = None
 
     class Breakpoint:
         """
         Class that represents the breakpoint set in the target binary.
         """
 
+        __slots__ = ("id", "address", "name")
+
         """Breakpoint identifier."""
         id: int
         """Breakpoint address."""
@@ -123,7 +245,15 @@ class GDBInjector(InternalInjector):
             self.name = name
 
     """List of breakpoints."""
-    breakpoints: list[Breakpoint] = []
+    breakpoints: list[Breakpoint]
+    """Breakpoints indexed by their identifier."""
+    _bp_by_id: dict[int, Breakpoint]
+    """Register values read since the target last stopped."""
+    _register_cache: dict[str, int]
+    """Memory words read since the target last stopped, indexed by (address, count)."""
+    _memory_cache: dict[tuple[int, int], list[int]]
+    """Memory mappings parsed since the target last stopped."""
+    _mappings_cache: list[Mapping] | None
 
     class State(enum.Enum):
         """
@@ -136,9 +266,38 @@ class GDBInjector(InternalInjector):
         EXIT = 3
 
     """Current state."""
-    state: State = State.STARTING
+    _state: State = State.STARTING
+    """Whether the current state is `RUNNING`, kept in sync by the `state` setter."""
+    _running: bool = False
+
+    @property
+    def state(self) -> State:
+        """
+        Property that returns the current state.
+
+        :return: the current state.
+        """
+
+        return self._state
+
+    @state.setter
+    def state(self, state: State) -> None:
+        """
+        Property setter that updates the current state.
+
+        :param state: the new state.
+        """
+
+        self._state = state
+        self._running = state is self.State.RUNNING
 
     def __init__(self, elf_path: str, **kwargs: dict[str, Any]) -> None:
+        self.breakpoints = []
+        self._bp_by_id = {}
+        self._register_cache = {}
+        self._memory_cache = {}
+        self._mappings_cache = None
+
         if "gdb_path" in kwargs and isinstance(kwargs["gdb_path"], str):
             self.gdb_path = kwargs["gdb_path"]
 
@@ -148,6 +307,9 @@ class GDBInjector(InternalInjector):
 
         self.controller.write("-gdb-set mi-async on")
 
+        if "no_ack" in kwargs and isinstance(kwargs["no_ack"], bool):
+            self.no_ack = kwargs["no_ack"]
+
         if "remote" in kwargs and isinstance(kwargs["remote"], str):
             self.remote(address=kwargs["remote"])
 
@@ -162,34 +324,42 @@ class GDBInjector(InternalInjector):
                 ):
                     self.board_family = BoardsFamilies[kwargs["board_family"].upper()]
                 else:
-                    log.warning(
-                        f"Board family not recognized: {kwargs['board_family']}, defaulting to `UNKNOWN`"
-                    )
-                    log.warning("List of supported board families:")
-                    for family in BoardsFamilies:
-                        log.warning(f" - {family.name}")
+                    ## The list of families is only joined when the warning is emitted
+                    if log.isEnabledFor(logging.WARNING):
+                        log.warning(
+                            "Board family not recognized: %s, defaulting to `UNKNOWN`. "
+                            "Supported board families: %s",
+                            kwargs.get("board_family"),
+                            ", ".join(family.name for family in BoardsFamilies),
+                        )
 
                     self.board_family = BoardsFamilies.UNKNOWN
 
         if "word_size" in kwargs and isinstance(kwargs["word_size"], int):
             self.word_size = kwargs["word_size"]
 
+        if self.word_size in WORD_FORMATS:
+            self._word_struct = get_struct(self.endianness, self.word_size, 1)
+
         self.reset()
 
         r = self.controller.write(
             "-data-list-register-names",
-            wait_for={
-                "type": "result",
-                "message": "done",
-                "payload": {"register-names": []},
-            },
+            wait_for=WAIT_REGISTER_NAMES,
         )
 
         self.register_names = r[0]["payload"]["register-names"]
+        self._register_numbers = {
+            name: number for number, name in enumerate(self.register_names) if name != ""
+        }
 
     def reset_stm32(self) -> None:
         """
-        Function that performs a hard reset on the target. This calls the monitor command `jtag_reset` in the st-util gdb server. Then, since the target is in a reset state, we wait for the DHCSR register to indicate that the target is in a reset state. If the target is not in a reset state, we wait for 0.5 seconds and check again.
+        Function that performs a hard reset on the target. This calls the monitor command
+        `jtag_reset` in the st-util gdb server. Then, since the target is in a reset state, we wait
+        for the DHCSR register to indicate that the target is in a reset state. If the target is not
+        in a reset state, we check again with an exponential backoff capped at 0.5 seconds, giving
+        up after 5 seconds.
         The library cannot do this on its own because it can't access the usb device directly since it's already occupied by _this_ gdb server.
 
         These values _should_ be portable since stlink uses them for everything, so it might be a standard.
@@ -197,21 +367,21 @@ class GDBInjector(InternalInjector):
 
         self.controller.write(
             '-interpreter-exec console "monitor jtag_reset"',
-            wait_for={
-                "type": "result",
-                "message": "done",
-                "payload": None,
-            },
+            wait_for=WAIT_DONE,
         )
 
-        STM32_REG_DHCSR = 0xE000EDF0
-        STM32_REG_DHCSR_S_RESET_ST = 1 << 25
-
-        dhcsr = self.read_memory(STM32_REG_DHCSR, self.word_size)[0]
+        ## Most resets complete within a few milliseconds, so poll quickly at first and back off
+        delay = 0.01
+        deadline = time.monotonic() + 5
+        dhcsr = self.read_memory(STM32_REG_DHCSR, self.word_size, cache=False)[0]
 
         while (dhcsr & STM32_REG_DHCSR_S_RESET_ST) == 0:
-            time.sleep(0.5)
-            dhcsr = self.read_memory(STM32_REG_DHCSR, self.word_size)[0]
+            if time.monotonic() > deadline:
+                log.critical("Timed out waiting for the target to reset")
+
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+            dhcsr = self.read_memory(STM32_REG_DHCSR, self.word_size, cache=False)[0]
 
     def reset_unknown(self) -> None:
         """
@@ -220,11 +390,7 @@ class GDBInjector(InternalInjector):
 
         self.controller.write(
             '-interpreter-exec console "monitor reset"',
-            wait_for={
-                "type": "result",
-                "message": "done",
-                "payload": None,
-            },
+            wait_for=WAIT_DONE,
         )
 
         ## Wait for the target to be in a reset state, it's not clear whether this is enough of a delay
@@ -239,12 +405,20 @@ class GDBInjector(InternalInjector):
         BoardsFamilies.UNKNOWN: reset_unknown,
     }
 
-    def reset(self) -> None:
+    def reset(self, keep_events: bool = False) -> None:
         """
         Function that resets the injector to a known initial state. Useful between test runs or injections.
+
+        :param keep_events: whether the breakpoints of the events already set survive the reset.
         """
 
-        self.controller.write("-break-delete")
+        self.invalidate_caches()
+        if not keep_events:
+            self.controller.write("-break-delete")
+
+            ## Every breakpoint was deleted, forget them so they do not pile up across runs
+            self.breakpoints = []
+            self._bp_by_id.clear()
 
         if self.embedded:
             self.controller.write("-target-reset")
@@ -254,13 +428,19 @@ class GDBInjector(InternalInjector):
         else:
             self.controller.write(
                 '-interpreter-exec console "start"',
-                wait_for={
-                    "message": "breakpoint-deleted",
-                    "payload": {"id": None},
-                    "type": "notify",
-                },
+                wait_for=WAIT_BREAKPOINT_DELETED,
             )
 
+    def invalidate_caches(self) -> None:
+        """
+        Function that drops every cached register, memory and mapping value. Called whenever the
+        target may have changed them.
+        """
+
+        self._register_cache.clear()
+        self._memory_cache.clear()
+        self._mappings_cache = None
+
     def is_running(self) -> bool:
         """
         Function that checks if the target is running.
@@ -268,7 +448,7 @@ class GDBInjector(InternalInjector):
         :return: True if the target is running.
         """
 
-        return self.state == self.State.RUNNING
+        return self._running
 
     def remote(self, address: str) -> gdb_response:
         """
@@ -283,8 +463,13 @@ class GDBInjector(InternalInjector):
         if not address.split(":")[1].isdigit():
             log.critical("Port must be an integer")
 
-        if not self.controller:
-            log.critical("GDB controller not initialized")
+        ## No-ack mode is only negotiated at connect time, GDB keeps acknowledging if the stub
+        ## refuses it
+        self.controller.write(
+            f"-gdb-set remote noack-packet {'on' if self.no_ack else 'off'}", WAIT_DONE
+        )
+        for setting in REMOTE_SETTINGS:
+            self.controller.write(f"-gdb-set {setting}", WAIT_DONE)
 
         return self.controller.write(f"-target-select extended-remote {address}")
 
@@ -295,61 +480,152 @@ class GDBInjector(InternalInjector):
         :param event: the event to set.
         """
 
-        if not self.controller:
-            log.critical("GDB controller not initialized")
         bp = self.controller.write(
             f"-break-insert {event}",
-            wait_for={
-                "message": "done",
-                "payload": {"bkpt": {}},
-                "type": "result",
-            },
+            wait_for=WAIT_BREAKPOINT,
         )
 
         if not bp[0]["message"] == "done":
             log.critical("Error setting event")
-        if not self.controller:
-            log.critical("GDB controller not initialized")
-        if self.is_running():
+        if self._running:
             log.critical("Injector is not running")
 
-        self.breakpoints.append(
-            self.Breakpoint(
-                id=int(bp[0]["payload"]["bkpt"]["number"]),
-                address=bp[0]["payload"]["bkpt"]["addr"],  ## TODO: actually parse this
-                name=event,
-            )
+        breakpoint = self.Breakpoint(
+            id=int(bp[0]["payload"]["bkpt"]["number"]),
+            address=bp[0]["payload"]["bkpt"]["addr"],  ## TODO: actually parse this
+            name=event,
         )
+        self.breakpoints.append(breakpoint)
+        self._bp_by_id[breakpoint.id] = breakpoint
+
+    def decode_memory(self, memory: list[dict[str, Any]], count: int) -> list[int]:
+        """
+        Function that decodes the chunks of a memory read into the target's words.
+        A single fully readable word, the most common read, skips the generic decoding.
 
-    def read_memory(self, address: int, count: int) -> list[int]:
+        :param memory: the memory chunks returned by GDB.
+        :param count: the number of bytes read.
+        :return: the decoded words.
+        """
+
+        if len(memory) > 1:
+            log.warning("Tried to read unreadable memory, filling the gaps with 0")
+        elif (
+            memory
+            and self._word_struct is not None
+            and count == self.word_size
+            and len(memory[0]["contents"]) == 2 * count
+        ):
+            return list(self._word_struct.unpack(bytes.fromhex(memory[0]["contents"])))
+
+        return parse_memory(memory, count, self.word_size, self.endianness)
+
+    def read_memory(self, address: int, count: int, cache: bool = False) -> list[int]:
         """
         Function that reads a memory word from the target.
+        With `cache=True`, values are kept until the target is resumed or written to; leave it off
+        for volatile memory such as peripheral registers.
 
         :param address: the memory address to read from.
         :param count: the number of bytes to read.
+        :param cache: whether the value can be served from, and stored in, the cache.
         :return: the value read from the target.
         """
 
-        if not self.controller:
-            log.critical("GDB controller not initialized")
-        if self.is_running():
+        if self._running:
             log.critical("Cannot read memory while process is running")
 
+        if cache and (cached := self._memory_cache.get((address, count))) is not None:
+            return list(cached)
+
         r = self.controller.write(
-            f"-data-read-memory-bytes {hex(address)} {count}",
-            wait_for={
-                "message": "done",
-                "payload": {"memory": []},
-                "stream": "stdout",
-                "token": None,
-                "type": "result",
-            },
+            f"-data-read-memory-bytes 0x{address:x} {count}",
+            wait_for=WAIT_MEMORY,
         )[0]
 
-        if len(r["payload"]["memory"]) > 1:
-            log.warning("Tried to read unreadable memory, filling the gaps with 0")
+        res = self.decode_memory(r["payload"]["memory"], count)
+        if cache:
+            self._memory_cache[(address, count)] = list(res)
 
-        return parse_memory(r["payload"]["memory"], count, self.word_size, self.endianness)
+        return res
+
+    def read_memory_many(
+        self, requests: list[tuple[int, int]], cache: bool = False
+    ) -> list[list[int]]:
+        """
+        Function that reads several memory ranges from the target, keeping all the requests that
+        are not served from the cache in flight at once.
+
+        :param requests: the (address, count) pairs to read.
+        :param cache: whether the values can be served from, and stored in, the cache.
+        :return: the values read for each request, in the same order.
+        """
+
+        if self._running:
+            log.critical("Cannot read memory while process is running")
+
+        keys = dict.fromkeys(requests)
+        values = {
+            key: self._memory_cache[key] for key in keys if cache and key in self._memory_cache
+        }
+        tokens = {
+            key: self.controller.submit(f"-data-read-memory-bytes 0x{key[0]:x} {key[1]}")
+            for key in keys
+            if key not in values
+        }
+
+        for (address, count), token in tokens.items():
+            r = self.controller.await_token(token)
+            values[(address, count)] = self.decode_memory(r["payload"]["memory"], count)
+            if cache:
+                self._memory_cache[(address, count)] = values[(address, count)]
+
+        return [list(values[key]) for key in requests]
+
+    def read_memory_block(self, address: int, count: int) -> bytes:
+        """
+        Function that reads a block of raw bytes from the target with a single request.
+        Unreadable bytes are filled with 0 and the block is never cached.
+
+        :param address: the memory address to read from.
+        :param count: the number of bytes to read.
+        :return: the bytes read from the target.
+        """
+
+        if self._running:
+            log.critical("Cannot read memory while process is running")
+
+        r = self.controller.write(
+            f"-data-read-memory-bytes 0x{address:x} {count}",
+            wait_for=WAIT_MEMORY,
+        )[0]
+
+        block = bytearray(count)
+        for chunk in r["payload"]["memory"]:
+            off = int(chunk["offset"], 16)
+            data = binascii.unhexlify(chunk["contents"])
+            block[off : off + len(data)] = data
+
+        return bytes(block)
+
+    def write_memory_block(self, address: int, data: bytes | bytearray | memoryview) -> None:
+        """
+        Function that writes a block of raw bytes to the target with a single request.
+        Any buffer is accepted and hex encoded in place, without copying it to bytes first.
+
+        :param address: the memory address to write to.
+        :param data: the bytes to write.
+        """
+
+        if self._running:
+            log.critical("Cannot write memory while process is running")
+
+        self._memory_cache.clear()
+
+        self.controller.write(
+            f"-data-write-memory-bytes 0x{address:x} {data.hex()}",
+            wait_for=WAIT_DONE,
+        )
 
     def write_memory(self, address: int, value: list[int], repeat: int) -> None:
         """
@@ -359,18 +635,16 @@ class GDBInjector(InternalInjector):
         :param value: the value to write.
         """
 
-        if not self.controller:
-            log.critical("GDB controller not initialized")
-        if self.is_running():
+        if self._running:
             log.critical("Cannot write memory while process is running")
 
+        ## Cached reads may overlap the written range in any way
+        self._memory_cache.clear()
+
+        payload = to_gdb_hex(value, self.endianness, self.word_size)
         self.controller.write(
-            f"-data-write-memory-bytes {hex(address)} {to_gdb_hex(value, self.endianness, self.word_size)} {hex(repeat)[2:]}e",
-            wait_for={
-                "message": "done",
-                "payload": None,
-                "type": "result",
-            },
+            f"-data-write-memory-bytes 0x{address:x} {payload} {repeat:x}e",
+            wait_for=WAIT_DONE,
         )
 
     def read_register(self, register: str) -> int:
@@ -381,27 +655,44 @@ class GDBInjector(InternalInjector):
         :return: the value read from the target.
         """
 
-        if not self.controller:
-            log.critical("GDB controller not initialized")
-        if self.is_running() and self.state == self.State.EXIT:
-            log.critical("Cannot read registers while process is running or has exited")
+        return self.read_registers([register])[register]
+
+    def read_registers(self, registers: list[str]) -> dict[str, int]:
+        """
+        Function that reads several registers from the target with a single request.
+
+        :param registers: the registers to read.
+        :return: the values read from the target, indexed by register name.
+        """
+
+        res = {}
+        numbers = {}
+        for register in registers:
+            if (cached := self._register_cache.get(register)) is not None:
+                res[register] = cached
+                continue
+
+            if (number := self._register_numbers.get(register)) is None:
+                log.critical(f"Register {register} not found")
+
+            numbers[str(number)] = register
+
+        if not numbers:
+            return res
 
         r = self.controller.write(
-            "-data-list-register-values d",
-            wait_for={
-                "message": "done",
-                "payload": {"register-values": []},
-                "type": "result",
-            },
+            f"-data-list-register-values d {' '.join(numbers)}",
+            wait_for=WAIT_REGISTER_VALUES,
         )[0]
 
-        idx = self.register_names.index(register)
-        val = r["payload"]["register-values"][idx]
+        for val in r["payload"]["register-values"]:
+            if val["value"].startswith("{"):
+                log.critical("Vector/Special registers not supported yet!")
 
-        if "value" in val:
-            log.critical("Vector/Special registers not supported yet!")
+            register = numbers[val["number"]]
+            res[register] = self._register_cache[register] = int(val["value"])
 
-        return int(val["value"])
+        return res
 
     def write_register(self, register: str, value: int) -> None:
         """
@@ -411,18 +702,12 @@ class GDBInjector(InternalInjector):
         :param value: the value to write.
         """
 
-        if not self.controller:
-            log.critical("GDB controller not initialized")
-        if self.is_running() and self.state == self.State.EXIT:
-            log.critical("Cannot write registers while process is running or has exited")
+        ## Registers can alias each other (e.g. sub-registers), drop them all
+        self._register_cache.clear()
 
         self.controller.write(
             f'-interpreter-exec console "set ${register}={hex(value)}"',
-            wait_for={
-                "message": "done",
-                "payload": None,
-                "type": "result",
-            },
+            wait_for=WAIT_DONE,
         )
 
     def close(self) -> None:
@@ -440,55 +725,62 @@ class GDBInjector(InternalInjector):
         :return: the name of the breakpoint hit.
         """
 
-        if not self.controller:
-            log.critical("GDB controller not initialized")
-
-        if self.is_running():
+        if self._running:
             log.warning("Injector is already running")
 
+        self.invalidate_caches()
         self.state = self.State.RUNNING
 
-        to_await: list[dict[str, Any]] = [
-            {"type": "result", "message": "running", "payload": None},
-            {
-                "type": "notify",
-                "message": "stopped",
-                "payload": {"reason": "breakpoint-hit", "bkptno": None},
-            },
-        ]
-
         bp = self.controller.write(
             "-exec-continue",
-            wait_for=to_await,
+            wait_for=[WAIT_RUNNING, WAIT_STOPPED],
             whole_response=True,
         )
+        if not blocking:
+            ## A stop may already be queued behind the running record
+            bp += self.controller.poll()
+
+        while (event := self.handle_stop(bp)) is None:
+            if not blocking:
+                self.state = self.State.EXIT
+                return "unknown"
 
-        while self.state == self.State.RUNNING:
             if stop_event and stop_event.is_set():
                 return "Timeout"
 
-            for msg in bp:
-                if msg["message"] != "stopped":
-                    continue
+            ## The target is already running, only a stop can end the wait
+            bp = self.controller.wait_response(
+                wait_for=WAIT_STOPPED, whole_response=True, stop_event=stop_event
+            )
 
-                if "reason" in msg["payload"] and msg["payload"]["reason"] == "exited-normally":
-                    self.state = self.State.EXIT
-                    return "exit"
+        return event
 
-                for b in self.breakpoints:
-                    if b.id == int(msg["payload"]["bkptno"]):
-                        self.state = self.State.INTERRUPT
-                        return b.name
+    def handle_stop(self, response: gdb_response) -> str | None:
+        """
+        Function that looks for the stop record in a response and updates the state accordingly.
 
-            if not blocking:
-                break
+        :param response: the records received since the target was resumed.
+        :return: the name of the breakpoint hit, "exit" if the process exited, None if it has not
+        stopped on either.
+        """
 
-            bp = self.controller.wait_response(
-                wait_for=to_await, whole_response=True, stop_event=stop_event
-            )
+        for msg in response:
+            if msg["message"] != "stopped":
+                continue
+
+            if msg["payload"].get("reason") in EXIT_REASONS:
+                self.state = self.State.EXIT
+                return "exit"
 
-        self.state = self.State.EXIT
-        return "unknown"
+            b = self._bp_by_id.get(int(msg["payload"].get("bkptno", -1)))
+            if b is not None:
+                self.state = self.State.INTERRUPT
+                return b.name
+
+            ## The target reports a single stop per continue, nothing after it is relevant
+            break
+
+        return None
 
     def get_register_names(self) -> list[str]:
         """
@@ -503,94 +795,74 @@ class GDBInjector(InternalInjector):
         """
         Function that interrupts the running process.
         """
+        self.invalidate_caches()
         self.state = self.State.INTERRUPT
         r = self.controller.write(
             "-exec-interrupt --all",
-            wait_for=[
-                {
-                    "type": "notify",
-                    "message": "stopped",
-                    "payload": {
-                        "reason": "signal-received",
-                        "signal-name": "SIGINT",
-                        "signal-meaning": "Interrupt",
-                        "frame": {},
-                        "thread-id": None,
-                    },
-                },
-                {
-                    "type": "notify",
-                    "message": "stopped",
-                    "payload": {"reason": "breakpoint-hit", "bkptno": None},
-                },
-                {
-                    "type": "notify",
-                    "message": "stopped",
-                    "payload": {
-                        "reason": "signal-received",
-                        "signal-name": "SIGTRAP",
-                        "signal-meaning": "Trace/breakpoint trap",
-                    },
-                },
-            ],
+            wait_for=WAIT_INTERRUPTED,
         )
 
         self.state = self.State.INTERRUPT
 
         if r[0]["message"] == "stopped" and r[0]["payload"]["reason"] == "breakpoint-hit":
-            for b in self.breakpoints:
-                if b.id == int(r[0]["payload"]["bkptno"]):
-                    self.state = self.State.INTERRUPT
-                    return b.name
+            b = self._bp_by_id.get(int(r[0]["payload"]["bkptno"]))
+            if b is not None:
+                return b.name
 
         return None
 
     def get_mappings(self) -> list[Mapping]:
         """
         Function that retrieves memory mappings using GDB's 'info proc mappings'
+        The mappings are cached until the target is resumed.
 
         :return: the list of memory mappings.
         """
 
-        self.controller.flush()
+        if self._mappings_cache is None:
+            self._mappings_cache = list(self._iter_mappings())
+
+        return list(self._mappings_cache)
+
+    def _iter_mappings(self) -> Iterator[Mapping]:
+        """
+        Function that parses the memory mappings using GDB's 'info proc mappings'.
+
+        :return: the iterator over the memory mappings.
+        """
+
         mappings = self.controller.write(
             '-interpreter-exec console "info proc mappings"',
-            wait_for={
-                "message": "done",
-                "payload": None,
-                "type": "result",
-            },
+            wait_for=WAIT_DONE,
             whole_response=True,
         )
-        perm_flags = {
-            "r": Mapping.Permissions.READ,
-            "w": Mapping.Permissions.WRITE,
-            "x": Mapping.Permissions.EXEC,
-            "p": Mapping.Permissions.PRIVATE,
-        }
-
-        res = []
-        for line in mappings[3:-1]:
-            parts = re.split(r"\s+", line["payload"])
-
-            if len(parts) < 5:
-                ## TODO: Log invalid mapping
-                return []
-
-            perms = 0
-            for c, p in zip("rwxp", parts[4]):
-                if p == c:
-                    perms |= perm_flags[p]
-
-            mapping = Mapping(
-                int(parts[0], 16),
-                int(parts[1], 16),
-                int(parts[2], 16),
-                int(parts[3], 16),
-                perms,
-                " ".join(parts[5:]) if len(parts) > 5 else "",
+        for line in mappings:
+            ## Only the console rows starting with an address describe a mapping
+            if line["type"] != "console":
+                continue
+
+            payload = line["payload"].strip()
+            if not payload.startswith("0x"):
+                continue
+
+            ## The file name is the last column and may contain spaces itself
+            parts = payload.split(None, 5)
+
+            ## Stray console output, e.g. a stop location, can also start with an address;
+            ## it is skipped so that the mappings after it are still read
+            try:
+                if len(parts) < 5:
+                    raise ValueError
+                start, end, size, offset = (int(part, 16) for part in parts[:4])
+            except ValueError:
+                log.debug("Skipping invalid mapping: %s", payload)
+                continue
+
+            yield Mapping(
+                start,
+                end,
+                size,
+                offset,
+                PERMISSIONS_TABLE.get(parts[4], 0),
+                parts[5] if len(parts) > 5 else "",
             )
-
-            res.append(mapping)
-
-        return res
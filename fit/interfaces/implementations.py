@@ -4,6 +4,11 @@ from typing import Type
 from fit.interfaces.gdb.gdb_injector import GDBInjector
 from fit.interfaces.internal_injector import InternalInjector
 
+"""Injector classes indexed by their lowercase implementation name."""
+IMPLEMENTATIONS: dict[str, Type[InternalInjector]] = {
+    "gdb": GDBInjector,
+}
+
 
 class Implementation(enum.Enum):
     """
@@ -21,7 +26,7 @@ class Implementation(enum.Enum):
         :return: the class corresponding to the given implementation name.
         """
 
-        if s.lower() == "gdb":
-            return GDBInjector.get_class()
-        else:
+        if (impl := IMPLEMENTATIONS.get(s.lower())) is None:
             raise ValueError(f"Unknown implementation: {s}")
+
+        return impl.get_class()
@@ -2,16 +2,22 @@ from __future__ import annotations
 
 import threading
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Self, Type
+from typing import Any, Callable, Literal, Self, Type
 
 from fit.mapping import Mapping
 
+## The struct format of an unsigned word, indexed by the word size in bytes
+WORD_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
 
 class InternalInjector(ABC):
     """
     Abstract class for managing the injection process into an ELF binary.
     """
 
+    """Endianness of the target architecture."""
+    endianness: Literal["little", "big"]
+
     @classmethod
     def get_class(cls) -> Type[Self]:  # Ensures correct subclass return type
         """
@@ -27,9 +33,11 @@ class InternalInjector(ABC):
         """Constructor method."""
 
     @abstractmethod
-    def reset(self: InternalInjector) -> None:
+    def reset(self: InternalInjector, keep_events: bool = False) -> None:
         """
         Function that resets the injector to a known initial state. Useful between test runs or injections.
+
+        :param keep_events: whether the events already set stay armed after the reset.
         """
 
     @abstractmethod
@@ -41,15 +49,51 @@ class InternalInjector(ABC):
         """
 
     @abstractmethod
-    def read_memory(self: InternalInjector, address: int, count: int) -> list[int]:
+    def read_memory(
+        self: InternalInjector, address: int, count: int, cache: bool = False
+    ) -> list[int]:
         """
         Function that reads a memory word from the target.
 
         :param address: the memory address to read from.
         :param count: the number of bytes to read.
+        :param cache: whether the value can be served from, and stored in, the cache.
         :return: the values read from the target.
         """
 
+    @abstractmethod
+    def read_memory_many(
+        self: InternalInjector, requests: list[tuple[int, int]], cache: bool = False
+    ) -> list[list[int]]:
+        """
+        Function that reads several memory ranges from the target, batching the requests.
+
+        :param requests: the (address, count) pairs to read.
+        :param cache: whether the values can be served from, and stored in, the cache.
+        :return: the values read for each request, in the same order.
+        """
+
+    @abstractmethod
+    def read_memory_block(self: InternalInjector, address: int, count: int) -> bytes:
+        """
+        Function that reads a block of raw bytes from the target with a single request.
+
+        :param address: the memory address to read from.
+        :param count: the number of bytes to read.
+        :return: the bytes read from the target.
+        """
+
+    @abstractmethod
+    def write_memory_block(
+        self: InternalInjector, address: int, data: bytes | bytearray | memoryview
+    ) -> None:
+        """
+        Function that writes a block of raw bytes to the target with a single request.
+
+        :param address: the memory address to write to.
+        :param data: the bytes to write.
+        """
+
     @abstractmethod
     def write_memory(self: InternalInjector, address: int, value: list[int], repeat: int) -> None:
         """
@@ -69,6 +113,15 @@ class InternalInjector(ABC):
         :return: the value read from the target.
         """
 
+    @abstractmethod
+    def read_registers(self: InternalInjector, registers: list[str]) -> dict[str, int]:
+        """
+        Function that reads several registers from the target with a single request.
+
+        :param registers: the registers to read.
+        :return: the values read from the target, indexed by register name.
+        """
+
     @abstractmethod
     def write_register(self: InternalInjector, register: str, value: int) -> None:
         """
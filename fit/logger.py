@@ -1,8 +1,10 @@
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Any
 
-from tqdm import tqdm
-
 
 class Logger(logging.Logger):
     """
@@ -58,7 +60,9 @@ class Logger(logging.Logger):
         :param kwargs: the additional keyword arguments passed to the logger.
         """
 
-        super().debug(self.format_message("DEBUG", msg), *args, **kwargs)
+        ## The colored message is only built when it is going to be emitted
+        if self.isEnabledFor(logging.DEBUG):
+            super().debug(self.format_message("DEBUG", msg), *args, **kwargs)
 
     def info(self, msg: str, *args: object, **kwargs: Any) -> None:  # type: ignore
         """
@@ -69,7 +73,8 @@ class Logger(logging.Logger):
         :param kwargs: the additional keyword arguments passed to the logger.
         """
 
-        super().info(self.format_message("INFO", msg), *args, **kwargs)
+        if self.isEnabledFor(logging.INFO):
+            super().info(self.format_message("INFO", msg), *args, **kwargs)
 
     def warning(self, msg: str, *args: object, **kwargs: Any) -> None:  # type: ignore
         """
@@ -80,7 +85,8 @@ class Logger(logging.Logger):
         :param kwargs: the additional keyword arguments passed to the logger.
         """
 
-        super().warning(self.format_message("WARNING", msg), *args, **kwargs)
+        if self.isEnabledFor(logging.WARNING):
+            super().warning(self.format_message("WARNING", msg), *args, **kwargs)
 
     def error(self, msg: str, *args: object, **kwargs: Any) -> None:  # type: ignore
         """
@@ -91,7 +97,8 @@ class Logger(logging.Logger):
         :param kwargs: the additional keyword arguments passed to the logger.
         """
 
-        super().error(self.format_message("ERROR", msg), *args, **kwargs)
+        if self.isEnabledFor(logging.ERROR):
+            super().error(self.format_message("ERROR", msg), *args, **kwargs)
 
     def critical(self, msg: str, *args: object, **kwargs: Any) -> None:  # type: ignore
         """
@@ -132,9 +139,39 @@ class TqdmLoggingHandler(logging.Handler):
         :param record: the log record to be emitted.
         """
 
+        ## tqdm is only needed once a record is emitted, importing fit.logger stays cheap
+        from tqdm import tqdm
+
         try:
             msg = self.format(record)
             tqdm.write(msg)
             self.flush()
         except Exception:
             self.handleError(record)
+
+
+@contextmanager
+def queued(log: logging.Logger) -> Iterator[None]:
+    """
+    Function that, for the duration of the context, only enqueues the records of a logger and
+    emits them through its handlers from a background thread, so the caller never waits on the
+    output. Every queued record is emitted before the context exits.
+
+    :param log: the logger.
+    """
+
+    handlers = log.handlers[:]
+    queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    listener = QueueListener(queue, *handlers, respect_handler_level=True)
+    for h in handlers:
+        log.removeHandler(h)
+    log.addHandler(queue_handler := QueueHandler(queue))
+
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        log.removeHandler(queue_handler)
+        for h in handlers:
+            log.addHandler(h)
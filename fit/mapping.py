@@ -3,6 +3,8 @@ class Mapping:
     Class representing a memory mapping.
     """
 
+    __slots__ = ("start", "end", "size", "offset", "permissions", "file")
+
     """The starting address of the memory mapping."""
     start: int
     """The ending address of the memory mapping."""
@@ -43,15 +45,11 @@ class Mapping:
         :return: the string representation of the memory mapping.
         """
 
-        perm = "r" if self.permissions & Mapping.Permissions.READ == 1 else "-"
-        perm += "w" if self.permissions & Mapping.Permissions.WRITE == 2 else "-"
-        perm += "x" if self.permissions & Mapping.Permissions.EXEC == 4 else "-"
-        perm += "p" if self.permissions & Mapping.Permissions.PRIVATE == 8 else "-"
+        perm = PERMISSION_STRINGS[self.permissions & 0xF]
 
         return (
-            f"Mapping(start={hex(self.start)},"
-            + f"end={hex(self.end)}, size={hex(self.size)},"
-            + f" offset={hex(self.offset)}, {perm}, {self.file})"
+            f"Mapping(start=0x{self.start:x},end=0x{self.end:x}, size=0x{self.size:x},"
+            f" offset=0x{self.offset:x}, {perm}, {self.file})"
         )
 
     @property
@@ -62,7 +60,7 @@ class Mapping:
         :return: True if the mapping is readable, False otherwise.
         """
 
-        return self.permissions & Mapping.Permissions.READ == 1
+        return bool(self.permissions & Mapping.Permissions.READ)
 
     @property
     def is_writable(self) -> bool:
@@ -72,7 +70,7 @@ class Mapping:
         :return: True if the mapping is writable, False otherwise.
         """
 
-        return self.permissions & Mapping.Permissions.WRITE == 2
+        return bool(self.permissions & Mapping.Permissions.WRITE)
 
     @property
     def is_executable(self) -> bool:
@@ -82,7 +80,7 @@ class Mapping:
         :return: True if the mapping is executable, False otherwise.
         """
 
-        return self.permissions & Mapping.Permissions.EXEC == 4
+        return bool(self.permissions & Mapping.Permissions.EXEC)
 
     @property
     def is_private(self) -> bool:
@@ -92,7 +90,7 @@ class Mapping:
         :return: True if the mapping is private, False otherwise.
         """
 
-        return self.permissions & Mapping.Permissions.PRIVATE == 8
+        return bool(self.permissions & Mapping.Permissions.PRIVATE)
 
     def as_range(self) -> range:
         """
@@ -102,3 +100,13 @@ class Mapping:
         """
 
         return range(self.start, self.end)
+
+
+## The "rwxp" string of every combination of the permission bits, indexed by the bits
+PERMISSION_STRINGS = [
+    ("r" if bits & Mapping.Permissions.READ else "-")
+    + ("w" if bits & Mapping.Permissions.WRITE else "-")
+    + ("x" if bits & Mapping.Permissions.EXEC else "-")
+    + ("p" if bits & Mapping.Permissions.PRIVATE else "-")
+    for bits in range(16)
+]
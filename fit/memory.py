@@ -1,8 +1,10 @@
-from typing import Union
+import operator
+import struct
+from typing import Union, cast
 
 from fit import logger
 from fit.elf import ELF
-from fit.interfaces.internal_injector import InternalInjector
+from fit.interfaces.internal_injector import WORD_FORMATS, InternalInjector
 from fit.mapping import Mapping
 
 log = logger.get()
@@ -13,102 +15,102 @@ class IntList(list[int]):
     Class that custom list for handling integer operations including bitwise and shift operators.
     """
 
-    def __or__(self, other: Union[int, "IntList"]) -> list[int]:
+    def __or__(self, other: Union[int, "IntList"]) -> "IntList":
         """
         Function that performs bitwise OR operation with an integer or another IntList.
 
         :param other: the integer or IntList to OR with.
-        :return: the list of integers after performing the OR operation.
+        :return: the IntList of integers after performing the OR operation.
         """
 
         if isinstance(other, int):
-            return list([x | other for x in self])
+            return IntList([x | other for x in self])
         elif isinstance(other, IntList):
             if len(other) != len(self):
                 log.critical("IntList must have the same length")
 
-            return [x | y for x, y in zip(self, other)]
+            return IntList(map(operator.or_, self, other))
 
-    def __ror__(self, other: int) -> list[int]:
+    def __ror__(self, other: int) -> "IntList":
         """
         Function that perform bitwise OR operation with an integer.
 
         :param other: the integer to OR with.
-        :return: the list of integers after performing the OR operation.
+        :return: the IntList of integers after performing the OR operation.
         """
 
-        return list([other | x for x in self])
+        return IntList([other | x for x in self])
 
-    def __xor__(self, other: Union[int, "IntList"]) -> list[int]:
+    def __xor__(self, other: Union[int, "IntList"]) -> "IntList":
         """
         Function that performs bitwise XOR operation with an integer or another IntList.
 
         :param other: the integer or IntList to XOR with.
-        :return: the list of integers after performing the XOR operation.
+        :return: the IntList of integers after performing the XOR operation.
         """
 
         if isinstance(other, int):
-            return list([x ^ other for x in self])
+            return IntList([x ^ other for x in self])
         elif isinstance(other, IntList):
             if len(other) != len(self):
                 log.critical(f"IntList must have the same length {len(other)} != {len(self)}.")
 
-            return [x ^ y for x, y in zip(self, other)]
+            return IntList(map(operator.xor, self, other))
 
-    def __rxor__(self, other: int) -> list[int]:
+    def __rxor__(self, other: int) -> "IntList":
         """
         Function that performs bitwise XOR operation with an integer.
 
         :param other: the integer to XOR with.
-        :return: the list of integers after performing the XOR operation.
+        :return: the IntList of integers after performing the XOR operation.
         """
-        return list([other ^ x for x in self])
+        return IntList([other ^ x for x in self])
 
-    def __and__(self, other: Union[int, "IntList"]) -> list[int]:
+    def __and__(self, other: Union[int, "IntList"]) -> "IntList":
         """
         Function that performs bitwise AND operation with an integer or another IntList.
 
         :param other: the integer or IntList to AND with.
-        :return: the list of integers after performing the AND operation.
+        :return: the IntList of integers after performing the AND operation.
         """
 
         if isinstance(other, int):
-            return list([x & other for x in self])
+            return IntList([x & other for x in self])
         elif isinstance(other, IntList):
             if len(other) != len(self):
                 log.critical("IntList must have the same length")
 
-            return [x & y for x, y in zip(self, other)]
+            return IntList(map(operator.and_, self, other))
 
-    def __rand__(self, other: int) -> list[int]:
+    def __rand__(self, other: int) -> "IntList":
         """
         Function that performs bitwise AND operation with an integer.
 
         :param other: the integer to AND with.
-        :return: the list of integers after performing the AND operation.
+        :return: the IntList of integers after performing the AND operation.
         """
 
-        return list([other & x for x in self])
+        return IntList([other & x for x in self])
 
-    def __lshift__(self, other: int) -> list[int]:
+    def __lshift__(self, other: int) -> "IntList":
         """
         Function that performs bitwise << operation with an integer.
 
         :param other: the integer to << with.
-        :return: the list of integers after performing the << operation.
+        :return: the IntList of integers after performing the << operation.
         """
 
-        return list([x << other for x in self])
+        return IntList([x << other for x in self])
 
-    def __rshift__(self, other: int) -> list[int]:
+    def __rshift__(self, other: int) -> "IntList":
         """
         Function that performs bitwise >> operation with an integer.
 
         :param other: the integer to >> with.
-        :return: the list of integers after performing the >> operation.
+        :return: the IntList of integers after performing the >> operation.
         """
 
-        return list([x >> other for x in self])
+        return IntList([x >> other for x in self])
 
 
 class Memory:
@@ -122,6 +124,10 @@ class Memory:
     elf: ELF
     """The word size."""
     word_size: int
+    """Whether reads may be served from the injector's cache, off for volatile memory."""
+    cache: bool
+    """The resolved (start, step, end) of every gdb-style symbol already looked up."""
+    _symbol_cache: dict[str, tuple[int, int, int]]
 
     @property
     def mappings(self) -> list[Mapping]:
@@ -133,13 +139,88 @@ class Memory:
 
         return self.__internal_injector.get_mappings()
 
-    def __init__(self, injector: InternalInjector, elf: ELF) -> None:
+    def __init__(self, injector: InternalInjector, elf: ELF, cache: bool = False) -> None:
         self.__internal_injector = injector
         self.elf = elf
         self.word_size = self.elf.bits // 8
+        self.cache = cache
+        self._symbol_cache = {}
 
-    # @overload
-    # def __getitem__(self, addr: int) -> int: ...
+    def resolve_symbol(self, addr: str) -> tuple[int, int, int]:
+        """
+        Function that resolves a gdb-style symbol, optionally with an offset, to its address range.
+
+        :param addr: the symbol, e.g. `var`, `var+0x4` or `var-2`.
+        :return: the start address, the size and the end address of the symbol.
+        """
+
+        cached = self._symbol_cache.get(addr)
+        if cached is not None:
+            return cached
+
+        location, sign, off = addr.partition("+")
+        if not sign:
+            location, sign, off = addr.partition("-")
+
+        offset = 0
+        if off:
+            ## Not int(off, 0), that would reject decimal offsets with leading zeros
+            offset = int(off, 16) if off.startswith("0x") else int(off)
+            if sign == "-":
+                offset = -offset
+
+        symbol = self.elf.symbols[location]
+        start = symbol.value + offset
+        step = symbol.size
+        resolved = (start, step, start + step)
+        self._symbol_cache[addr] = resolved
+
+        return resolved
+
+    def resolve_range(self, addr: int | str | slice) -> tuple[int, int, int]:
+        """
+        Function that resolves a memory address, symbol or range of addresses to its bounds.
+
+        :param addr: the memory address, symbol or range of addresses.
+        :return: the start address, the element size and the end address.
+        """
+
+        if isinstance(addr, str):
+            return self.resolve_symbol(addr)
+        elif isinstance(addr, int):
+            return addr, self.word_size, addr + self.word_size
+
+        # Use addr.start, addr.stop, addr.step (with defaults if needed)
+        start = addr.start if addr.start is not None else 0
+        if addr.stop is None:
+            raise ValueError("Slice stop must be specified")
+
+        step = addr.step if addr.step is not None else self.word_size
+        return start, step, addr.stop
+
+    def read_many(self, addrs: list[int | str | slice]) -> list[int | IntList]:
+        """
+        Function that gets the value(s) at several memory addresses or ranges of addresses, with all
+        the word-sized reads in flight at once.
+
+        :param addrs: the memory addresses or ranges of addresses.
+        :return: the value(s) at each address, in the same order, as returned by `memory[addr]`.
+        """
+
+        ranges = [self.resolve_range(addr) for addr in addrs]
+        batched = [(start, end - start) for start, step, end in ranges if step >= self.word_size]
+        values = iter(self.__internal_injector.read_memory_many(batched, self.cache))
+
+        res: list[int | IntList] = []
+        for addr, (_, step, _) in zip(addrs, ranges):
+            if step < self.word_size:
+                res.append(self[addr])
+                continue
+
+            value = next(values)
+            res.append(value[0] if len(value) == 1 else IntList(value))
+
+        return res
 
     # @overload
     # def __getitem__(self, addr: str) -> int: ...
@@ -155,54 +236,32 @@ class Memory:
         :return: the value(s) at a specific memory address or range of addresses.
         """
 
-        if isinstance(addr, str):
-            """
-            Support gdb-style symbols
-            """
-
-            location = addr
-            offset = 0
-            if location.count("+") == 1:
-                location, off = location.split("+")
-
-                if off.startswith("0x"):
-                    offset = int(off, 16)
-                else:
-                    offset = int(off)
-
-            elif location.count("-") == 1:
-                location, off = location.split("-")
-
-                if off.startswith("0x"):
-                    offset = -int(off, 16)
-                else:
-                    offset = -int(off)
-
-            start = self.elf.symbols[location].value + offset
-            step = self.elf.symbols[location].size
-            end = start + step
-        elif isinstance(addr, int):
-            start = addr
-            step = self.word_size
-            end = start + step
-        elif isinstance(addr, slice):
-            # Use addr.start, addr.stop, addr.step (with defaults if needed)
-            start = addr.start if addr.start is not None else 0
-            if addr.stop is None:
-                raise ValueError("Slice stop must be specified")
-
-            end = addr.stop
-            step = addr.step if addr.step is not None else self.word_size
+        ## A single word is the most common access, skip the range bookkeeping for it
+        if addr.__class__ is int:
+            return self.__internal_injector.read_memory(
+                cast(int, addr), self.word_size, self.cache
+            )[0]
+
+        start, step, end = self.resolve_range(addr)
 
         if step < self.word_size:
-            res = IntList(
-                [
-                    self.__internal_injector.read_memory(true_addr, step)[0]
-                    for true_addr in range(start, end, step)
-                ]
-            )
+            ## Sub-word elements come from a single block read instead of one request each
+            count = len(range(start, end, step)) * step
+            block = self.__internal_injector.read_memory_block(start, count)
+            endianness = self.__internal_injector.endianness
+            if (word_format := WORD_FORMATS.get(step)) is not None:
+                byteorder = "<" if endianness == "little" else ">"
+                res = IntList(struct.unpack(f"{byteorder}{count // step}{word_format}", block))
+            else:
+                res = IntList(
+                    [int.from_bytes(block[i : i + step], endianness) for i in range(0, count, step)]
+                )
         else:
-            res = IntList(self.__internal_injector.read_memory(start, end - start))
+            words = self.__internal_injector.read_memory(start, end - start, self.cache)
+            if len(words) == 1:
+                return words[0]
+
+            res = IntList(words)
 
         if len(res) == 1:
             return res[0]
@@ -229,57 +288,36 @@ class Memory:
         :param value: the value(s) to set.
         """
 
-        if isinstance(addr, str):
-            """
-            Support gdb-style symbols
-            """
-
-            location = addr
-            offset = 0
-            if location.count("+") == 1:
-                location, off = location.split("+")
-
-                if off.startswith("0x"):
-                    offset = int(off, 16)
-                else:
-                    offset = int(off)
-
-            elif location.count("-") == 1:
-                location, off = location.split("-")
-
-                if off.startswith("0x"):
-                    offset = -int(off, 16)
-                else:
-                    offset = -int(off)
-
-            start = self.elf.symbols[location].value + offset
-            step = self.elf.symbols[location].size
-            end = start + step
-        elif isinstance(addr, int):
-            start = addr
-            step = self.word_size
-            end = start + step
-        elif isinstance(addr, slice):
-            # Use addr.start, addr.stop, addr.step (with defaults if needed)
-            start = addr.start if addr.start is not None else 0
-            if addr.stop is None:
-                raise ValueError("Slice stop must be specified")
-
-            end = addr.stop
-            step = addr.step if addr.step is not None else self.word_size
+        if addr.__class__ is int and value.__class__ is int:
+            self.__internal_injector.write_memory(
+                cast(int, addr), [cast(int, value)], self.word_size
+            )
+            return
+
+        start, step, end = self.resolve_range(addr)
 
         if isinstance(value, int):
             self.__internal_injector.write_memory(start, [value], end - start)
         else:
-            if isinstance(value, IntList):
-                value = list(value)
-
             if step < self.word_size:
+                ## Consecutive non-zero elements are packed and written with a single request
+                endianness = self.__internal_injector.endianness
+                mask = (1 << (step * 8)) - 1
+                run_start = start
+                run = bytearray()
                 for true_addr, val in zip(range(start, end, step), value):
                     if val == 0:
+                        if run:
+                            self.__internal_injector.write_memory_block(run_start, run)
+                            run = bytearray()
                         continue
 
-                    self.__internal_injector.write_memory(true_addr, [val], step)
+                    if not run:
+                        run_start = true_addr
+                    run += (val & mask).to_bytes(step, endianness)
+
+                if run:
+                    self.__internal_injector.write_memory_block(run_start, run)
             else:
                 self.__internal_injector.write_memory(start, value, len(value) * self.word_size)
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import random
+import struct
+from typing import Callable
 
 from fit.distribution import Distribution, Uniform
+from fit.interfaces.internal_injector import WORD_FORMATS
 from fit.memory import IntList
 
 
@@ -19,7 +22,7 @@ class Stencil:
     """
 
     """The distribution for the offsets."""
-    offset_distribution: Distribution
+    _offset_distribution: Distribution
     """The distribution for selecting patterns."""
     pattern_distribution: Distribution
     """The patterns to use for the stencil."""
@@ -28,6 +31,16 @@ class Stencil:
     pattern_size_in_words: int
     """The word size for the stencil."""
     word_size: int
+    """The mask of a single word."""
+    max_value: int
+    """The number of words of a pattern generated by `random`."""
+    random_chunks: int
+    """The number of words of a pattern generated by `layer`."""
+    layer_chunks: int
+    """Splits a pattern generated by `random` into its words."""
+    split_random: Callable[[int], IntList]
+    """Splits a pattern generated by `layer` into its words."""
+    split_layer: Callable[[int], IntList]
 
     def __init__(
         self,
@@ -36,43 +49,102 @@ class Stencil:
         pattern_distribution: Distribution = Uniform(0, 0),
         word_size: int = 4,
     ) -> None:
-        self.offset_distribution = offset_distribution
         self.pattern_distribution = pattern_distribution
         self.patterns = [patterns] if isinstance(patterns, int) else patterns
+        self.word_size = word_size
         self.bits = word_size * 8
+        self.max_value = (1 << self.bits) - 1
         self.pattern_size = max(
             # Here we want to find the biggest pattern, we subtract one from
             # bits(pattern) since if we have a pattern like 0xffffffff we would have
             # a pattern that would be larger than needed
-            [((bits(pattern) - 1) // self.bits) + 1 for pattern in self.patterns]
+            ((bits(pattern) - 1) // self.bits) + 1
+            for pattern in self.patterns
         )
 
+        self.offset_distribution = offset_distribution
+
         assert len(self.patterns) > 0, "At least one pattern must be provided."
         assert len(self.patterns) - 1 == pattern_distribution.length(), (
             "Number of patterns must match chooser length."
         )
 
-    def random(self) -> IntList:
+    @property
+    def offset_distribution(self) -> Distribution:
         """
-        Function that generates a random pattern based on the stencil's distributions.
+        Property that returns the distribution for the offsets.
 
-        :return: the IntList representing the random pattern.
+        :return: the distribution for the offsets.
+        """
+
+        return self._offset_distribution
+
+    @offset_distribution.setter
+    def offset_distribution(self, distribution: Distribution) -> None:
+        """
+        Property that sets the distribution for the offsets, and the pattern sizes that depend on
+        it.
+
+        :param distribution: the distribution for the offsets.
+        """
+
+        self._offset_distribution = distribution
+
+        offlen = distribution.length()
+        offlen = offlen - 1 if offlen > 0 else 1
+        self.random_chunks = (offlen) // self.bits + (self.pattern_size)
+        self.layer_chunks = distribution.length() // self.bits + (self.pattern_size - 1)
+        self.split_random = self.splitter(self.random_chunks)
+        self.split_layer = self.splitter(self.layer_chunks)
+
+    def random_value(self) -> int:
+        """
+        Function that generates a random pattern, shifted by a random offset, as a single integer.
+
+        :return: the shifted pattern.
         """
 
         pattern = self.patterns[self.pattern_distribution.random()]
-        val = pattern << self.offset_distribution.random()
+        return pattern << self.offset_distribution.random()
 
-        max_value = (1 << self.bits) - 1
-        offlen = (
-            self.offset_distribution.length() - 1 if self.offset_distribution.length() > 0 else 1
-        )
-        max_number_of_chunks = (offlen) // self.bits + (self.pattern_size)
+    def splitter(self, count: int) -> Callable[[int], IntList]:
+        """
+        Function that builds a function splitting an integer into its lowest words, least
+        significant first. The word count, sizes and masks are bound once, so each split only does
+        the conversion.
+
+        :param count: the number of words.
+        :return: the function splitting an integer into an IntList of the words.
+        """
+
+        if (word_format := WORD_FORMATS.get(self.word_size)) is None:
+            bits = self.bits
+            max_value = self.max_value
+
+            def split_words(val: int) -> IntList:
+                return IntList([(val >> (bits * i)) & max_value for i in range(count)])
 
-        res = [0 for _ in range(max_number_of_chunks)]
-        for i in range(max_number_of_chunks):
-            res[i] = (val >> (self.bits * i)) & max_value
+            return split_words
 
-        return IntList(res)
+        ## Split the pattern into words with a single linear copy, shifting it once per word
+        ## copies the whole number every time
+        nbytes = count * self.word_size
+        mask = (1 << (nbytes * 8)) - 1
+        unpack = struct.Struct(f"<{count}{word_format}").unpack
+
+        def split_bytes(val: int) -> IntList:
+            return IntList(unpack((val & mask).to_bytes(nbytes, "little")))
+
+        return split_bytes
+
+    def random(self) -> IntList:
+        """
+        Function that generates a random pattern based on the stencil's distributions.
+
+        :return: the IntList representing the random pattern.
+        """
+
+        return self.split_random(self.random_value())
 
     def layer(self, max_times: int, min_times: int = 0) -> IntList:
         """
@@ -85,14 +157,10 @@ class Stencil:
 
         assert min_times <= max_times, "Minimum times must be less than maximum times."
 
-        max_number_of_chunks = self.offset_distribution.length() // self.bits + (
-            self.pattern_size - 1
-        )
-        res = [0 for _ in range(max_number_of_chunks)]
+        ## XOR works word by word, so the patterns are layered as whole integers and
+        ## split into words only once at the end
+        res = 0
         for _ in range(random.randint(min_times, max_times)):
-            choice = self.random()
-
-            for i in range(len(res)):
-                res[i] ^= choice[i]
+            res ^= self.random_value()
 
-        return IntList(res)
+        return self.split_layer(res)
@@ -1,26 +1,98 @@
+from __future__ import annotations
+
 import csv
 import json
-import random
-from collections import Counter, defaultdict
+from collections import Counter
 from datetime import timedelta
-from typing import Any, DefaultDict, Literal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, DefaultDict, Literal, cast
 
 import click
-import pandas as pd
-import yaml
-from tqdm import tqdm
 
 from fit import logger
 from fit.csv import import_from_csv
 from fit.distribution import Fixed, Uniform
-from fit.elf import ELF
-from fit.fitlib import gdb_injector
-from fit.injector import Injector
-from fit.interfaces.implementations import Implementation
-from fit.stencil import Stencil
+
+## lief, pandas, numpy and the injector backends are imported where they are needed,
+## so that --help and configuration errors do not pay for them
+if TYPE_CHECKING:
+    from fit.injector import Injector
+    from fit.stencil import Stencil
 
 log = logger.get()
 
+## An operation applies a stencil to a target (memory or registers) at a location
+Operation = Callable[[Any, slice | str | int, "Stencil"], None]
+
+
+def operation_xor(target: Any, where: slice | str | int, gen: Stencil) -> None:
+    """
+    Function that XORs a random pattern into the target at a location.
+
+    :param target: the memory or registers of the injector.
+    :param where: the location in the target.
+    :param gen: the stencil generating the pattern.
+    """
+
+    target[where] ^= gen.random()
+
+
+def operation_and(target: Any, where: slice | str | int, gen: Stencil) -> None:
+    """
+    Function that ANDs a random pattern into the target at a location.
+
+    :param target: the memory or registers of the injector.
+    :param where: the location in the target.
+    :param gen: the stencil generating the pattern.
+    """
+
+    target[where] &= gen.random()
+
+
+def operation_or(target: Any, where: slice | str | int, gen: Stencil) -> None:
+    """
+    Function that ORs a random pattern into the target at a location.
+
+    :param target: the memory or registers of the injector.
+    :param where: the location in the target.
+    :param gen: the stencil generating the pattern.
+    """
+
+    target[where] |= gen.random()
+
+
+def operation_zero(target: Any, where: slice | str | int, gen: Stencil) -> None:
+    """
+    Function that zeroes the target at a location.
+
+    :param target: the memory or registers of the injector.
+    :param where: the location in the target.
+    :param gen: the stencil generating the pattern, unused.
+    """
+
+    target[where] = 0
+
+
+def operation_value(target: Any, where: slice | str | int, gen: Stencil) -> None:
+    """
+    Function that writes a random pattern to the target at a location.
+
+    :param target: the memory or registers of the injector.
+    :param where: the location in the target.
+    :param gen: the stencil generating the pattern.
+    """
+
+    target[where] = gen.random()
+
+
+OPERATIONS: dict[str, Operation] = {
+    "xor": operation_xor,
+    "and": operation_and,
+    "or": operation_or,
+    "zero": operation_zero,
+    "value": operation_value,
+}
+
 
 def format_memory_addr(s: slice | int) -> str:
     if not isinstance(s, slice):
@@ -44,55 +116,84 @@ def to_mem_val(element: str) -> slice | int:
 """
 
 
-def format_memory_range(golden: str, run: str, format: bool = True) -> str:
-    golden = json.loads(golden)
-    run = json.loads(run)
+@lru_cache(maxsize=None)
+def parse_memory_words(s: str) -> tuple[int, ...]:
+    """
+    Function that parses the words of a memory range as stored in the report CSVs.
+    The golden value of a range is compared with every distinct value it took, so it is parsed once.
+
+    :param s: the JSON list of words.
+    :return: the words.
+    """
+
+    return tuple(int(v) for v in json.loads(s))
 
-    gvals = [int(v) for v in golden]
-    rvals = [int(v) for v in run]
 
-    diff = [gold - r for gold, r in zip(gvals, rvals)]
+def format_memory_range(golden_str: str, run_str: str, format: bool = True) -> str:
+    import numpy as np
 
-    if len(diff) == 1:
-        if diff[0] != 0:
+    golden = parse_memory_words(golden_str)
+    rvals = parse_memory_words(run_str)
+    length = min(len(golden), len(rvals))
+
+    ## Only the differing words are printed, so jump straight from one to the next
+    differing = np.flatnonzero(
+        np.fromiter(golden, dtype=np.uint64, count=length)
+        != np.fromiter(rvals, dtype=np.uint64, count=length)
+    ).tolist()
+
+    if length == 1:
+        if differing:
             return "\033[31m" + hex(rvals[0])[2:] + "\033[0m..."
         else:
             return hex(rvals[0])[2:]
 
-    res = hex(rvals[0])[2:]
+    separator = "\033[0m..." if format else "..."
+    ## The pieces of the output are collected and joined once at the end
+    parts = [hex(rvals[0])[2:]]
 
+    ## count is -1 before the first difference, otherwise the number of equal words
+    ## since the last one
     count = -1
-    for i, v in enumerate(diff):
-        if v == 0:
+    previous = -1
+    for i in [*differing, length]:
+        equal = i - previous - 1
+        if equal > 0:
             if count == 0:
-                if format:
-                    res += "\033[0m..."
-                else:
-                    res += "..."
-            count += 1
-
-        else:
-            if count == -1:
+                parts.append(separator)
+                count = equal
+            elif equal > 1:
+                parts.append(separator)
+                count = equal - 1
+            else:
                 count = 0
 
-                res = ""
+        if i == length:
+            break
 
-            if count > 0:
-                res += f"[{i}]..."
-                count = 0
+        if count == -1:
+            count = 0
+
+            parts.clear()
+
+        if count > 0:
+            parts.append(f"[{i}]...")
+            count = 0
 
-            if format:
-                res += "\033[31m"
+        if format:
+            parts.append("\033[31m")
 
-            res += hex(rvals[i])[2:]
+        parts.append(hex(rvals[i])[2:])
+        previous = i
 
     if count == 1:
-        res = res[:-3]
-        res += hex(rvals[-1])[2:]
+        parts[-1] = parts[-1][:-3]
+        parts.append(hex(rvals[-1])[2:])
     elif count > 1:
-        res += f"[{count - 1}]...{hex(rvals[-1])[2:]}"
+        parts.append(f"[{count - 1}]...{hex(rvals[-1])[2:]}")
 
-    return res + "\033[0m"
+    parts.append("\033[0m")
+    return "".join(parts)
 
 
 def print_report(config: dict[str, Any]) -> None:
@@ -101,70 +202,83 @@ def print_report(config: dict[str, Any]) -> None:
 
     :param config: the configuration dictionary.
     """
+    from fit.elf import ELF
+
     exp_name = config["configuration"]["experiment_name"]
     golden_result_condition = config["configuration"]["golden_result_condition"]
     result_conditions = config["configuration"]["result_condition"]
 
     elf = ELF(config["configuration"]["executable"])
-    ## Keep these in line
-    runs = import_from_csv(exp_name + ".csv")
     golden = import_from_csv(exp_name + "_golden.csv")
 
-    count_different_from_golden = defaultdict(Counter)
-    for key in runs:
-        count_different_from_golden[key] = Counter(runs[key])
-
-    if "Timeout" not in count_different_from_golden["result"]:
-        count_different_from_golden["result"]["Timeout"] = 0
-
-    if golden_result_condition not in count_different_from_golden["result"]:
-        count_different_from_golden["result"][golden_result_condition] = 0
-
-    for condition in result_conditions:
-        if condition not in count_different_from_golden["result"]:
-            count_different_from_golden["result"][condition] = 0
+    ## A single pass over the runs counts every column and collects, without duplicates,
+    ## the runs whose result differs from the golden one
+    number_of_runs = 0
+    differing_runs: dict[tuple[str, ...], None] = {}
+    with open(exp_name + ".csv", mode="r", newline="", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        columns = next(reader, [])
+        counters: list[Counter[str]] = [Counter() for _ in columns]
+        result_index = columns.index("result")
+        for row in reader:
+            number_of_runs += 1
+            for counter, value in zip(counters, row):
+                counter[value] += 1
+
+            if row[result_index] != golden["result"][0]:
+                differing_runs[tuple(row)] = None
+
+    count_different_from_golden = dict(zip(columns, counters))
+
+    ## Outcomes that never happened are still listed, with a count of 0, after the ones that did
+    count_different_from_golden.setdefault("result", Counter()).update(
+        dict.fromkeys(("Timeout", golden_result_condition, *result_conditions), 0)
+    )
 
     for key in golden:
         if key != "result":
-            if golden[key][0] not in count_different_from_golden[key]:
-                count_different_from_golden[key][golden[key][0]] = 0
+            count_different_from_golden.setdefault(key, Counter()).setdefault(golden[key][0], 0)
 
+    word_bytes = elf.bits // 8
     print(f"Injection Result:")
-    for key in count_different_from_golden:
+    for key, counts in count_different_from_golden.items():
         print(f"{key}:")
-        for i in count_different_from_golden[key].keys():
-            if key.startswith("0x") or (
-                elf.symbols[key] is not None and elf.symbols[key].size > elf.bits // 8
-            ):
-                pr = format_memory_range(golden[key][0], i)
+        ## Whether the column is a memory range only depends on the column, so the symbol
+        ## table is looked up once per column instead of once per value
+        if key.startswith("0x"):
+            is_range = True
+        else:
+            sym = elf.symbols[key]
+            is_range = sym is not None and sym.size > word_bytes
+        golden_value = golden[key][0]
+        for i, count in counts.items():
+            if is_range:
+                pr = format_memory_range(golden_value, i)
             else:
                 pr = f"{i}"
 
-            if i == golden[key][0]:
+            if i == golden_value:
                 pr = pr.replace("\033[31m", "")
                 pr = pr.replace("\033[0m", "")
-                print(
-                    f" - \033[33m{pr}: {count_different_from_golden[key][i]} / {len(runs[key])}\033[0m"
-                )
+                print(f" - \033[33m{pr}: {count} / {number_of_runs}\033[0m")
             else:
-                print(f" - {pr}: {count_different_from_golden[key][i]} / {len(runs[key])}")
+                print(f" - {pr}: {count} / {number_of_runs}")
         print()
 
-    experiment_df = pd.read_csv(exp_name + ".csv")
-    experiment_df_filtered = experiment_df[
-        experiment_df["result"] != golden["result"][0]
-    ].drop_duplicates()
+    ## Each run is formatted as a whole line, against golden values stringified once
+    golden_values = [None if col == "result" else str(golden[col][0]) for col in columns]
+    lines = [
+        " - "
+        + " ".join(
+            val if golden_val is None or val == golden_val else f"\033[33m{val}\033[0m"
+            for golden_val, val in zip(golden_values, differing_run)
+        )
+        for differing_run in differing_runs
+    ]
 
     print(f"\n\nRuns that differ from golden:")
-    for i, row in experiment_df_filtered.iterrows():
-        print(" - ", end="")
-        for col in experiment_df_filtered.columns:
-            val = str(row[col])
-            if col != "result" and val != str(golden[col][0]):
-                print(f"\033[33m{val}\033[0m", end=" ")
-            else:
-                print(val, end=" ")
-        print()
+    if lines:
+        print("\n".join(lines))
 
 
 @click.command()
@@ -211,10 +325,21 @@ def main(
     :param log_level: the logging level.
     """
 
+    import numpy as np
+    import pandas as pd
+    import yaml
+    from tqdm import tqdm
+
+    from fit.fitlib import gdb_injector
+    from fit.interfaces.implementations import Implementation
+    from fit.stencil import Stencil
+
     log.setLevel(str(log_level).upper())
 
+    ## The libyaml bindings are optional, fall back to the pure Python loader without them
+    loader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(config_file, "r") as yml_file:
-        config = yaml.load(yml_file, Loader=yaml.FullLoader)
+        config = yaml.load(yml_file, Loader=loader)
 
     if config.get("configuration") is None:
         log.critical(
@@ -272,6 +397,7 @@ def main(
             embedded = False
 
         board_family = config["configuration"]["gdb"].get("board_family", "UNKNOWN")
+        cache_memory = config["configuration"]["gdb"].get("cache_memory", False)
 
         if remote is None:
             if "remote" not in config["configuration"]["gdb"]:
@@ -287,6 +413,7 @@ def main(
             gdb_path=gdb_path,
             embedded=embedded,
             board_family=board_family,
+            cache_memory=cache_memory,
         )
     else:
         log.error(f"Unrecognized injector backend, list of supported backends:")
@@ -307,14 +434,45 @@ def main(
     injector_variables = []
     injector_registers = []
     injector_memories = []
+    ## Every memory target is parsed once, by its string in the injector csv
+    memory_targets: dict[str, slice | int] = {}
 
     for element in injector_csv["where"].unique().tolist():
-        if element in inj.regs.registers:
+        ## No register name starts with 0x, so the prefix is checked before the register set
+        if element.startswith("0x"):
+            memory_targets[element] = to_mem_val(element)
+            injector_memories.append(memory_targets[element])
+        elif element in inj.regs.register_set:
             injector_registers.append(element)
-        elif element.startswith("0x"):
-            injector_memories.append(to_mem_val(element))
         else:
             injector_variables.append(element)
+    register_targets = set(injector_registers)
+    variable_targets = set(injector_variables)
+
+    ## The report column of each memory target is formatted once, not on every run
+    injector_memory_names = [format_memory_addr(memory) for memory in injector_memories]
+    snapshot_addresses: list[int | str | slice] = [*injector_variables, *injector_memories]
+
+    def snapshot(inj: Injector, result: str) -> dict[str, Any]:
+        """
+        Function that builds the report row of a run, reading every observed variable, register
+        and memory range. All the memory reads are in flight at once and the registers are read
+        with a single request.
+
+        :param inj: the injector.
+        :param result: the result of the run.
+        :return: the row of the run, indexed by report column.
+        """
+
+        values = inj.memory.read_many(snapshot_addresses)
+        variable_count = len(injector_variables)
+
+        ## A single dict is filled in the usual order of the report columns
+        run: dict[str, Any] = {"result": result}
+        run.update(zip(injector_variables, values[:variable_count]))
+        run.update(zip(injector_registers, inj.regs.read_many(injector_registers)))
+        run.update(zip(injector_memory_names, values[variable_count:]))
+        return run
 
     # Start Golden Run
     log.info("Starting golden run")
@@ -327,12 +485,7 @@ def main(
     if result in result_conditions:
         log.error(f"Golden run didn't reach end: got {result} expected: {golden_result_condition}")
 
-    golden_run = {
-        "result": result,
-        **{variable: inj.memory[variable] for variable in injector_variables},
-        **{register: inj.regs[register] for register in injector_registers},
-        **{format_memory_addr(memory): inj.memory[memory] for memory in injector_memories},
-    }
+    golden_run = snapshot(inj, result)
     # log.info(golden_run)
     inj.add_run(golden_run, True)
 
@@ -342,114 +495,101 @@ def main(
         log.removeHandler(h)
     log.addHandler(logger.TqdmLoggingHandler())
 
-    for i in tqdm(range(number_of_runs), desc="Runs", unit="run"):
-        log.info(f"Run: {i + 1}/{number_of_runs}")
+    ## Only the random draws change between runs, so every target is prepared once
+    targets: list[tuple[Operation, slice | str | int, bool, Stencil]] = []
+    probabilities: list[float] = []
+    ## A single grouping pass, in order of first appearance, yields the rows of each
+    ## (where, operation, operation_probability) choice
+    for key, selected_df in injector_csv.groupby(
+        ["where", "operation", "operation_probability"], sort=False, dropna=False
+    ):
+        where, operation, probability = cast(tuple[str, str, float], key)
+        if operation not in OPERATIONS:
+            log.critical(f"Invalid operation for injection: {operation}")
+
+        probabilities.append(probability)
+
+        actual: slice | str | int = where
+        offsets = Uniform(0, 0)
+        is_register = where in register_targets
+        if is_register:
+            ## A register is a single word, its pattern is never shifted
+            pass
+        elif where in variable_targets:
+            sym = inj.binary.symbols[where]
+            offsets = Uniform(
+                0, ((sym.value + sym.size) - sym.value) * 8, granularity=inj.binary.bits
+            )
+        elif where in memory_targets:
+            actual = memory_targets[where]
+            if isinstance(actual, slice):
+                offsets = Uniform(0, (actual.stop - actual.start) * 8, granularity=inj.binary.bits)
+        else:
+            log.critical("Invalid target for injection")
+
+        gen = Stencil(
+            # Which value uses during injection
+            patterns=selected_df["value"].tolist(),
+            # Where the value is placed in the target
+            offset_distribution=offsets,
+            # Which distribution uses during injection
+            pattern_distribution=Fixed(selected_df["value_probability"].tolist()),
+            word_size=inj.binary.bits // 8,
+        )
+
+        targets.append((OPERATIONS[operation], actual, is_register, gen))
+
+    ## The targets and injection delays of every run are drawn upfront in one batch,
+    ## searching the cumulative weights for each uniform draw
+    rng = np.random.default_rng()
+    cdf = np.cumsum(probabilities)
+    drawn_targets = iter(
+        np.minimum(
+            np.searchsorted(cdf, rng.random(number_of_runs) * cdf[-1], side="right"),
+            len(targets) - 1,
+        ).tolist()
+    )
+    drawn_delays = [
+        timedelta(milliseconds=delay)
+        for delay in rng.integers(inj_min, inj_max, endpoint=True, size=number_of_runs).tolist()
+    ]
+    run_timeout = timedelta(milliseconds=timeout)
+
+    def injection_function(inj: Injector) -> None:
         """
-        Setup procedure
+        Function that executes the injection.
+
+        :param inj: the injection.
         """
-        inj.reset()
-        inj.set_result_condition(golden_result_condition)
-        for condition in result_conditions:
-            inj.set_result_condition(condition)
 
-        def injection_function(inj: Injector) -> None:
-            """
-            Function that executes the injection.
+        apply, actual, is_register, gen = targets[next(drawn_targets)]
 
-            :param inj: the injection.
-            """
+        apply(inj.regs if is_register else inj.memory, actual, gen)
 
-            # where, operation, operation_probability
-            where_operation_probability = list(
-                injector_csv[["where", "operation", "operation_probability"]]
-                .drop_duplicates()
-                .itertuples(index=False, name=None)
-            )
-            choices = [(w, op, p) for w, op, p in where_operation_probability]
-            weights = [p for w, op, p in where_operation_probability]
-            where_operation_selected = random.choices(choices, weights=weights, k=1)[0]
-
-            selected_where_operation_probability_df = injector_csv[
-                (injector_csv["where"] == where_operation_selected[0])
-                & (injector_csv["operation"] == where_operation_selected[1])
-                & (injector_csv["operation_probability"] == where_operation_selected[2])
-            ]
-
-            # Where to do injection
-            where = where_operation_selected[0]
-            # Which operation executes to do injection
-            operation = where_operation_selected[1]
-            # Which value uses during injection
-            values = selected_where_operation_probability_df["value"].tolist()
-            # Which distribution uses during injection
-            distribution = selected_where_operation_probability_df["value_probability"].tolist()
+    ## The runs only enqueue their log records, the terminal output happens in the background
+    with logger.queued(log):
+        for i in tqdm(range(number_of_runs), desc="Runs", unit="run"):
+            log.info("Run: %d/%d", i + 1, number_of_runs)
+            """
+            Setup procedure
+            """
+            ## The result conditions set for the golden run are the same for every run
+            inj.reset(keep_conditions=True)
 
-            gen = Stencil(
-                patterns=values,
-                pattern_distribution=Fixed(distribution),
-                word_size=inj.binary.bits // 8,
+            result = inj.run(
+                timeout=run_timeout,
+                injection_delay=drawn_delays[i],
+                inject_func=injection_function,
             )
 
-            if where in injector_variables or to_mem_val(where) in injector_memories:
-                actual: slice | str | int = where
-                if where not in injector_variables:
-                    actual = to_mem_val(where)
-
-                if isinstance(actual, str):
-                    sym = inj.binary.symbols[where]
-                    gen.offset_distribution = Uniform(
-                        0, ((sym.value + sym.size) - sym.value) * 8, granularity=inj.binary.bits
-                    )
-
-                if isinstance(actual, slice):
-                    gen.offset_distribution = Uniform(
-                        0, (actual.stop - actual.start) * 8, granularity=inj.binary.bits
-                    )
-
-                if operation == "xor":
-                    inj.memory[actual] ^= gen.random()
-                elif operation == "and":
-                    inj.memory[actual] &= gen.random()
-                elif operation == "or":
-                    inj.memory[actual] |= gen.random()
-                elif operation == "zero":
-                    inj.memory[actual] = 0
-                elif operation == "value":
-                    inj.memory[actual] = gen.random()
-
-            elif where in injector_registers:
-                if operation == "xor":
-                    inj.regs[where] ^= gen.random()
-                elif operation == "and":
-                    inj.regs[where] &= gen.random()
-                elif operation == "or":
-                    inj.regs[where] |= gen.random()
-                elif operation == "zero":
-                    inj.regs[where] = 0
-                elif operation == "value":
-                    inj.regs[where] = gen.random()
-            else:
-                log.critical("Invalid target for injection")
-
-        result = inj.run(
-            timeout=timedelta(milliseconds=timeout),
-            injection_delay=timedelta(milliseconds=random.randint(inj_min, inj_max)),
-            inject_func=injection_function,
-        )
+            log.info(result)
 
-        log.info(result)
-
-        """
-        Look at the memory and registers
-        """
-        run = {
-            "result": result,
-            **{variable: inj.memory[variable] for variable in injector_variables},
-            **{register: inj.regs[register] for register in injector_registers},
-            **{format_memory_addr(memory): inj.memory[memory] for memory in injector_memories},
-        }
-        inj.add_run(run)
-        # log.info(str(run))
+            """
+            Look at the memory and registers
+            """
+            run = snapshot(inj, result)
+            inj.add_run(run)
+            log.debug("run=%r", run)
 
     inj.save(experiment_name)
     inj.close()
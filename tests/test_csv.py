@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from fit.csv import export_to_csv, import_from_csv
+
+
+def test_csv_export(tmp_path: Path) -> None:
+    path = tmp_path / "runs.csv"
+    export_to_csv(str(path), {"result": ["END", "Timeout"], "var": [[1, 2], [3, 4]], "golden": 5})
+
+    assert path.read_bytes() == b'result,var,golden\r\nEND,"[1, 2]",5\r\nTimeout,"[3, 4]",5\r\n'
+
+
+def test_csv_import(tmp_path: Path) -> None:
+    path = tmp_path / "runs.csv"
+
+    path.write_text('result,var\r\nEND,"[1, 2]"\r\n"a,\nb",0x10\r\n', encoding="utf-8")
+    assert import_from_csv(str(path)) == {"result": ["END", "a,\nb"], "var": ["[1, 2]", "0x10"]}
+
+    path.write_text("result,var\r\n", encoding="utf-8")
+    assert import_from_csv(str(path)) == {}
+
+    ## A round trip gives back every value as a string
+    export_to_csv(str(path), {"result": ["END", "CRASH"], "rip": [4198710, 4198720]})
+    assert import_from_csv(str(path)) == {"result": ["END", "CRASH"], "rip": ["4198710", "4198720"]}
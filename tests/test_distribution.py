@@ -0,0 +1,17 @@
+import random
+
+from fit.distribution import Fixed
+
+
+def test_fixed_distribution() -> None:
+    assert Fixed([0.2, 0.3, 0.5]).cdf == [0.2, 0.5, 1.0]
+
+    ## A choice with all the probability is always picked
+    assert {Fixed([1.0]).random() for _ in range(100)} == {0}
+    assert {Fixed([1.0, 0.0]).random() for _ in range(100)} == {0}
+    assert {Fixed([0.0, 1.0]).random() for _ in range(100)} == {1}
+    assert {Fixed([0.0, 0.0, 1.0]).random() for _ in range(100)} == {2}
+
+    random.seed(1234)
+    distribution = Fixed([0.2, 0.3, 0.5])
+    assert [distribution.random() for _ in range(12)] == [2, 1, 0, 2, 2, 2, 2, 0, 2, 1, 0, 2]
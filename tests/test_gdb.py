@@ -1,6 +1,8 @@
 import platform
+from typing import Any, cast
 
-from fit.interfaces.gdb.gdb_injector import get_int, parse_memory
+from fit.interfaces.gdb.controller import GDBController, gdb_response
+from fit.interfaces.gdb.gdb_injector import GDBInjector, get_int, parse_memory, to_gdb_hex
 
 
 def test_gdb_value_parsing() -> None:
@@ -8,6 +10,12 @@ def test_gdb_value_parsing() -> None:
     assert get_int("abcdefab", "big") == 0xABCDEFAB
 
 
+def test_gdb_hex_encoding() -> None:
+    assert to_gdb_hex([0xABCDEFAB], "little", 4) == "abefcdab"
+    assert to_gdb_hex([0xABCDEFAB], "big", 4) == "abcdefab"
+    assert to_gdb_hex([0x2_00000001, 3], "little", 8) == "01000000020000000300000000000000"
+
+
 def test_gdb_memory_parsing() -> None:
     val = [
         {
@@ -33,3 +41,211 @@ def test_gdb_memory_parsing() -> None:
         assert parse_memory(val, 12, 8, "little") == [0x2_00000001, 3]
     else:
         assert parse_memory(val, 12, 8, "little") == [0x1, 2, 3]
+
+    ## A chunk that does not start at the beginning of the read lands at its word offset
+    val = [
+        {
+            "begin": "0x0000000000404018",
+            "offset": "0x0000000000000008",
+            "end": "0x0000000000404020",
+            "contents": "0100000002000000",
+        }
+    ]
+
+    assert parse_memory(val, 16, 4, "little") == [0, 0, 1, 2]
+    assert parse_memory(val, 16, 8, "little") == [0, 0x2_00000001]
+
+    ## A chunk reaching past the requested size never makes the result longer
+    val = [
+        {
+            "begin": "0x0000000000404010",
+            "offset": "0x0000000000000004",
+            "end": "0x0000000000404020",
+            "contents": "01000000020000000300000004000000",
+        }
+    ]
+
+    assert parse_memory(val, 8, 4, "little") == [0, 1]
+
+
+class Controller:
+    """
+    Stand-in for a GDB session that answers every command with the same records.
+    """
+
+    def __init__(self, response: gdb_response) -> None:
+        self.response = response
+        self.commands: list[str] = []
+
+    def write(
+        self, command: str, wait_for: Any = None, whole_response: bool = False
+    ) -> gdb_response:
+        self.commands.append(command)
+        return self.response
+
+
+def stub_injector(controller: Controller) -> GDBInjector:
+    inj = GDBInjector.__new__(GDBInjector)
+    inj.controller = cast(Any, controller)
+    inj._register_cache = {}
+    inj._memory_cache = {}
+    inj._mappings_cache = None
+    inj._bp_by_id = {}
+
+    return inj
+
+
+def test_gdb_mappings_cache() -> None:
+    controller = Controller(
+        [
+            {"type": "console", "payload": "Start Addr End Addr Size Offset Perms objfile\n"},
+            {"type": "console", "payload": "0x400000 0x401000 0x1000 0x0 r-xp /bin/true\n"},
+            {"type": "result", "message": "done", "payload": None},
+        ]
+    )
+    inj = stub_injector(controller)
+
+    mappings = inj.get_mappings()
+    assert [(m.start, m.end, m.file) for m in mappings] == [(0x400000, 0x401000, "/bin/true")]
+
+    ## Callers get a copy, the cached list is left alone
+    mappings.clear()
+    assert len(inj.get_mappings()) == 1
+    assert len(controller.commands) == 1
+
+    inj.invalidate_caches()
+    assert len(inj.get_mappings()) == 1
+    assert len(controller.commands) == 2
+
+
+def test_gdb_run_exit() -> None:
+    inj = stub_injector(
+        Controller(
+            [
+                {"type": "result", "message": "running", "payload": None},
+                {"type": "notify", "message": "stopped", "payload": {"reason": "exited-normally"}},
+            ]
+        )
+    )
+
+    assert inj.run(blocking=True) == "exit"
+    assert inj.state is GDBInjector.State.EXIT
+
+
+class Session:
+    """
+    Stand-in for the pygdbmi session that replays scripted reads.
+    """
+
+    def __init__(self, reads: list[gdb_response]) -> None:
+        self.reads = reads
+        self.commands: list[str] = []
+
+    def write(
+        self, command: str, raise_error_on_timeout: bool = True, read_response: bool = True
+    ) -> gdb_response:
+        self.commands.append(command)
+        return self.get_gdb_response() if read_response else []
+
+    def get_gdb_response(
+        self, timeout_sec: float = 1, raise_error_on_timeout: bool = True
+    ) -> gdb_response:
+        return self.reads.pop(0) if self.reads else []
+
+
+def stub_controller(session: Session) -> GDBController:
+    ctrl = GDBController.__new__(GDBController)
+    ctrl.controller = cast(Any, session)
+    ctrl.token = 0
+    ctrl.pending = set()
+    ctrl.completed = {}
+    ctrl.backlog = []
+
+    return ctrl
+
+
+def result(token: int | None, message: str = "done") -> dict[str, Any]:
+    return {"type": "result", "message": message, "payload": None, "token": token}
+
+
+def test_gdb_write_between_tokens() -> None:
+    ctrl = stub_controller(Session([[result(1), result(None)]]))
+
+    token = ctrl.submit("-data-read-memory-bytes 0x1000 4")
+    assert ctrl.write("-break-delete 1", wait_for={"type": "result", "token": None}) == [
+        result(None)
+    ]
+    assert ctrl.await_token(token) == result(token)
+
+
+def test_gdb_token_keeps_records() -> None:
+    stopped = {"type": "notify", "message": "stopped", "payload": {}, "token": None}
+    ctrl = stub_controller(Session([[stopped, result(2)], [result(1)]]))
+
+    first = ctrl.submit("-data-read-memory-bytes 0x1000 4")
+    second = ctrl.submit("-data-read-memory-bytes 0x2000 4")
+    assert ctrl.await_token(second) == result(second)
+    assert ctrl.await_token(first) == result(first)
+
+    ## The stop seen while waiting is not lost
+    assert ctrl.poll() == [stopped]
+    assert ctrl.poll() == []
+
+
+def test_gdb_memory_cache() -> None:
+    controller = Controller(
+        [
+            {
+                "type": "result",
+                "message": "done",
+                "payload": {
+                    "memory": [
+                        {
+                            "begin": "0x1000",
+                            "offset": "0x0",
+                            "end": "0x1004",
+                            "contents": "2a000000",
+                        }
+                    ]
+                },
+            }
+        ]
+    )
+    inj = stub_injector(controller)
+    inj._running = False
+    inj._word_struct = None
+    inj.word_size = 4
+    inj.endianness = "little"
+
+    assert inj.read_memory(0x1000, 4) == [42]
+    assert inj.read_memory(0x1000, 4) == [42]
+    assert len(controller.commands) == 2
+
+    assert inj.read_memory(0x1000, 4, cache=True) == [42]
+    assert inj.read_memory(0x1000, 4, cache=True) == [42]
+    assert len(controller.commands) == 3
+
+    inj.invalidate_caches()
+    assert inj.read_memory(0x1000, 4, cache=True) == [42]
+    assert len(controller.commands) == 4
+
+
+def test_gdb_mappings_parsing() -> None:
+    inj = stub_injector(
+        Controller(
+            [
+                {"type": "console", "payload": "Start Addr End Addr Size Offset Perms objfile\n"},
+                {"type": "console", "payload": "0x400000 0x401000 0x1000 0x0 r-xp /bin/true\n"},
+                {"type": "console", "payload": "0x401000 in main () at main.c:3\n"},
+                {"type": "console", "payload": "0x7ff000 0x800000 0x1000 0x0 rw-p\n"},
+                {"type": "console", "payload": "0x900000 0x901000 0x1000 0x0 r--p /tmp/a b.so\n"},
+                {"type": "result", "message": "done", "payload": None},
+            ]
+        )
+    )
+
+    assert [(m.start, m.end, m.file) for m in inj.get_mappings()] == [
+        (0x400000, 0x401000, "/bin/true"),
+        (0x7FF000, 0x800000, ""),
+        (0x900000, 0x901000, "/tmp/a b.so"),
+    ]
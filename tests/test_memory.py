@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+from typing import Any, cast
+
+from fit.memory import Memory
+
+
+class Symbols(dict[str, Any]):
+    lookups = 0
+
+    def __getitem__(self, name: str) -> Any:
+        self.lookups += 1
+        return super().__getitem__(name)
+
+
+def test_symbol_resolution() -> None:
+    symbols = Symbols(var=SimpleNamespace(value=0x404010, size=8))
+    memory = Memory(cast(Any, None), cast(Any, SimpleNamespace(bits=64, symbols=symbols)))
+
+    assert memory.resolve_symbol("var") == (0x404010, 8, 0x404018)
+    assert memory.resolve_symbol("var+0x4") == (0x404014, 8, 0x40401C)
+    assert memory.resolve_symbol("var+4") == (0x404014, 8, 0x40401C)
+    assert memory.resolve_symbol("var+010") == (0x40401A, 8, 0x404022)
+    assert memory.resolve_symbol("var-0x10") == (0x404000, 8, 0x404008)
+    assert memory.resolve_symbol("var-2") == (0x40400E, 8, 0x404016)
+
+    ## Every symbol string is only looked up in the ELF once
+    assert memory.resolve_symbol("var+4") == (0x404014, 8, 0x40401C)
+    assert symbols.lookups == 6
+
+
+def test_range_resolution() -> None:
+    symbols = Symbols(var=SimpleNamespace(value=0x404010, size=8))
+    memory = Memory(cast(Any, None), cast(Any, SimpleNamespace(bits=64, symbols=symbols)))
+
+    assert memory.resolve_range("var+4") == (0x404014, 8, 0x40401C)
+    assert memory.resolve_range(0x1000) == (0x1000, 8, 0x1008)
+    assert memory.resolve_range(slice(0x1000, 0x1010)) == (0x1000, 8, 0x1010)
+    assert memory.resolve_range(slice(0x1000, 0x1010, 2)) == (0x1000, 2, 0x1010)
+
+
+class Reads:
+    def __init__(self) -> None:
+        self.cache: list[bool] = []
+
+    def read_memory(self, address: int, count: int, cache: bool = False) -> list[int]:
+        self.cache.append(cache)
+        return [0]
+
+
+def test_memory_cache_flag() -> None:
+    elf = cast(Any, SimpleNamespace(bits=64, symbols={}))
+
+    reads = Reads()
+    assert Memory(cast(Any, reads), elf)[0x1000] == 0
+    assert Memory(cast(Any, reads), elf, cache=True)[0x1000] == 0
+    assert reads.cache == [False, True]
@@ -0,0 +1,29 @@
+import json
+
+from main import format_memory_range
+
+
+def fmt(golden: list[int], run: list[int], format: bool = True) -> str:
+    return format_memory_range(json.dumps(golden), json.dumps(run), format)
+
+
+def test_memory_range_formatting() -> None:
+    assert fmt([1], [1]) == "1"
+    assert fmt([1], [2]) == "\033[31m2\033[0m..."
+
+    assert fmt([1, 2, 3, 4], [1, 2, 3, 4]) == "1\033[0m...[2]...4\033[0m"
+    assert fmt([1, 2, 3, 4], [1, 9, 3, 4]) == "1\033[31m9\033[0m...[1]...4\033[0m"
+    assert fmt([1, 2, 3, 4], [1, 9, 3, 4], False) == "19...[1]...4\033[0m"
+    assert fmt([1, 2, 3, 4], [0, 2, 3, 5]) == "\033[31m0\033[0m...[3]...\033[31m5\033[0m"
+
+    assert fmt([1, 2, 3, 4, 5, 6], [1, 2, 3, 4, 5, 7]) == "1\033[0m...[5]...\033[31m7\033[0m"
+    assert fmt([1, 2, 3, 4, 5, 6], [7, 2, 3, 4, 5, 6], False) == "7...[4]...6\033[0m"
+    assert fmt([0, 0, 0, 0, 0], [0, 1, 0, 1, 0]) == (
+        "0\033[31m1\033[0m...[3]...\033[31m1\033[0m0\033[0m"
+    )
+
+    ## Words are printed in hex
+    assert fmt([0xFF, 0x10], [0xFE, 0x10]) == "\033[31mfe\033[0m10\033[0m"
+
+    ## A run longer than the golden one is compared up to the golden length
+    assert fmt([1, 2, 3], [1, 2, 3, 4], False) == "1...[1]...4\033[0m"
@@ -0,0 +1,27 @@
+from typing import Any
+
+from fit.injector import Injector
+
+
+class ExitingInjector:
+    """
+    Stand-in for an internal injector whose target exits without hitting any event.
+    """
+
+    def run(self, blocking: bool = False, stop_event: Any = None) -> str:
+        return "exit"
+
+
+def test_run_exit() -> None:
+    inj = Injector.__new__(Injector)
+    setattr(inj, "_Injector__internal_injector", ExitingInjector())
+    inj.events = {}
+
+    assert inj.run() == "exit"
+
+    ## A result condition set on the exit still gets its callback
+    exits: list[Injector] = []
+    inj.events["exit"] = Injector.Event(exits.append)
+
+    assert inj.run() == "exit"
+    assert exits == [inj]
@@ -0,0 +1,51 @@
+import random
+
+from fit.distribution import Fixed, Uniform
+from fit.stencil import Stencil
+
+
+def test_stencil_splitting() -> None:
+    stencil = Stencil([0x1FF], word_size=1)
+    assert stencil.random() == [0xFF, 0x1]
+    assert stencil.layer(3, 3) == [0xFF]
+    assert stencil.layer(2, 2) == [0x0]
+
+    stencil = Stencil(0xDEADBEEF_CAFEBABE, word_size=4)
+    assert stencil.random() == [0xCAFEBABE, 0xDEADBEEF]
+    assert stencil.layer(3, 3) == [0xCAFEBABE]
+    assert stencil.layer(2, 2) == [0x0]
+
+    stencil = Stencil(0xDEADBEEF_CAFEBABE, word_size=8)
+    assert stencil.random() == [0xDEADBEEF_CAFEBABE]
+    assert stencil.layer(3, 3) == []
+
+    ## Word sizes without a struct format are split by hand
+    stencil = Stencil(0xABCDEF123456, word_size=3)
+    assert stencil.random() == [0x123456, 0xABCDEF]
+    assert stencil.layer(3, 3) == [0x123456]
+    assert stencil.layer(2, 2) == [0x0]
+
+    assert Stencil(0xFF, offset_distribution=Uniform(12, 12)).random() == [0xFF000]
+    assert Stencil(0xFF, offset_distribution=Uniform(40, 40)).random() == [0x0]
+
+
+def test_stencil_seeded() -> None:
+    random.seed(1234)
+    stencil = Stencil(
+        patterns=[0x1, 0xF00D],
+        offset_distribution=Uniform(0, 64, granularity=8),
+        pattern_distribution=Fixed([0.25, 0.75]),
+        word_size=4,
+    )
+
+    assert stencil.random() == [0x0, 0xD000000]
+    assert stencil.random() == [0x100, 0x0]
+    assert stencil.random() == [0xF00D, 0x0]
+    assert stencil.random() == [0xF00D00, 0x0]
+    assert stencil.random() == [0x0, 0x100]
+    assert stencil.random() == [0x1, 0x0]
+
+    assert stencil.layer(3) == [0x0, 0x0]
+    assert stencil.layer(3) == [0xF00D0000, 0xD000000]
+    assert stencil.layer(3) == [0x0, 0x0]
+    assert stencil.layer(3) == [0xF00D, 0x0]